@@ -1,10 +1,65 @@
 # app.py - Main GUI Application for Face Recognition System (Modern Dark Theme)
 
+import os
+
+# Cap the BLAS/OpenMP thread pools so numpy, OpenCV, torch and TF don't each spawn
+# one thread per core. These only take effect if set before those libraries are imported.
+BLAS_THREADS = 2
+OPENCV_THREADS = 4
+TORCH_THREADS = 2
+# Processes used to encode training images; each one loads its own detector and dlib models
+TRAINING_WORKERS = max(1, min(4, os.cpu_count() or 1))
+# Concurrent copies when importing photos (the copies are I/O-bound and release the GIL)
+COPY_WORKERS = 8
+# Video frames with faces collected before one batched dlib encoder call
+VIDEO_ENCODE_BATCH = 16
+# Live camera: reuse the last detection while the scene is this still (mean abs difference
+# of a 32x24 thumbnail, 0-255) and the detection is younger than the max age in seconds
+STATIC_FRAME_DIFF = 2.0
+STATIC_FRAME_MAX_AGE = 1.0
+# Below this many images the pool start-up (a detector load per worker) costs more than it saves
+PARALLEL_TRAINING_MIN_IMAGES = 16
+# Largest encoding distance accepted as a match (was 0.35 too strict, 0.45 too loose)
+MATCH_THRESHOLD = 0.40
+# Live camera: a face whose box centre stays in the same bucket (pixels of the detection frame)
+# keeps its name for this many detection passes before it is encoded and matched again
+FACE_TRACK_BUCKET = 16
+FACE_TRACK_TTL = 5
+# Live camera with a 68-point ("large") model: faces are encoded with the 5-point landmarks first and
+# only re-encoded with "large" when the nearest known face is between these distances (not clearly in or out)
+STREAM_CONFIDENT_DISTANCE = 0.35
+STREAM_UNKNOWN_DISTANCE = 0.6
+# Live DeepFace overlay: most people kept, and camera frames a person can be off screen before being dropped
+ANALYSIS_CACHE_SIZE = 32
+ANALYSIS_MAX_AGE = 300
+# Live DeepFace: seconds between analysis rounds at the least (longer if analysis itself is slower)
+ANALYSIS_MIN_INTERVAL = 0.3
+# Smart Attendance: milliseconds between moving newly marked students into the list
+ATTENDANCE_FLUSH_MS = 500
+# Smart Attendance: JPEG quality of saved attendance photos
+ATTENDANCE_JPEG_QUALITY = 85
+for _env_var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_env_var, str(BLAS_THREADS))
+
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import tkinter.font as tkfont
 import threading
+import queue
+import time
+import functools
+import gc
+import sys
+import multiprocessing
+import contextlib
+import weakref
 from typing import Optional
 import cv2
+cv2.setNumThreads(OPENCV_THREADS)
+# Let OpenCV run resize/colour conversion on the GPU (e.g. Intel iGPU) through OpenCL when present
+OPENCL_AVAILABLE = cv2.ocl.haveOpenCL()
+if OPENCL_AVAILABLE:
+    cv2.ocl.setUseOpenCL(True)
 from PIL import Image, ImageTk, ImageDraw, ImageFilter, ImageFont
 try:
     import face_recognition
@@ -13,18 +68,32 @@ except ImportError:
     FACE_RECOGNITION_AVAILABLE = False
     print("WARNING: face_recognition not available. Install dlib to enable face recognition.")
     print("See INSTALL_DLIB_WINDOWS.md for installation instructions.")
+try:
+    import keyring
+    KEYRING_AVAILABLE = True
+except ImportError:
+    KEYRING_AVAILABLE = False
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+try:
+    from turbojpeg import TurboJPEG
+    _turbojpeg = TurboJPEG()  # Raises if the libjpeg-turbo library itself can't be found
+except (ImportError, OSError, RuntimeError):
+    _turbojpeg = None
 import pickle
+import json
+import importlib.util
+import importlib.metadata
 from pathlib import Path
-from collections import Counter
+from collections import Counter, OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
 import shutil
-import os
 import numpy as np
-from datetime import date, datetime
-from yolo_face_detector import YOLOFaceDetector
-from yolov8_detector import YOLOv8FaceDetector
-from retinaface_detector import RetinaFaceDetector
-from deepface_detector import DeepFaceDetector
-from deepface_calibration import DeepFaceCalibrator
+from datetime import date, datetime, timedelta
 from video_utils import extract_frames_from_video, process_video_for_training, get_video_frames
 from gemini_live_api import GeminiLiveAPI
 try:
@@ -50,17 +119,720 @@ PROCESSED_FILES_PATHS = {
     "deepface": Path("output/processed_files_deepface.pkl"),
 }
 
+# Gemini API key storage (OS keyring when available, plaintext file otherwise)
+GEMINI_KEY_FILE = Path("output/gemini_api_key.txt")
+KEYRING_SERVICE = "FaceRecognitionApp"
+KEYRING_USERNAME = "gemini"
+
+# Read buffer used for encoding/processed-file pickles
+PICKLE_BUFFER_SIZE = 1 << 20
+
 # Default model
 DEFAULT_MODEL = "yolov11"
+# Detectors whose detect_faces_cv2 takes BGR frames as-is (ultralytics reads numpy input as BGR)
+BGR_NATIVE_MODELS = frozenset({"yolov11", "yolov8"})
+
+# Short description of each detection model (homepage)
+MODEL_DESCRIPTIONS = {
+    "yolov11": "Latest YOLO, best accuracy",
+    "yolov8": "Stable YOLO version",
+    "retinaface": "Deep learning with landmarks",
+    "deepface": "Face recognition + Emotion/Age/Race/Gender",
+}
+
+# Training page model options: (label, model name, info); optional backends pick one variant
+MODEL_OPTIONS_BASE = (
+    ("YOLOv11", "yolov11", "Latest YOLO, best accuracy"),
+    ("YOLOv8", "yolov8", "Stable YOLO version"),
+)
+RETINAFACE_OPTION = ("RetinaFace", "retinaface", "Deep learning with landmarks")
+RETINAFACE_NEEDS_TF_KERAS_OPTION = ("RetinaFace (Needs tf-keras)", "retinaface", "Install: pip install tf-keras")
+RETINAFACE_MISSING_OPTION = ("RetinaFace (Not Available)", "retinaface", "Check dependencies")
+DEEPFACE_OPTION = ("DeepFace", "deepface", "Face recognition + Emotion/Age/Race/Gender")
+DEEPFACE_MISSING_OPTION = ("DeepFace (Not Installed)", "deepface", "Install: pip install deepface")
+
 TRAINING_DIR = Path("training")
 OUTPUT_DIR = Path("output")
 VALIDATION_DIR = Path("validation")
 
+# Supported training/test file types (lowercase - compare against suffix.lower())
+IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.bmp', '.gif'})
+VIDEO_EXTS = frozenset({'.mp4', '.avi', '.mov', '.mkv'})
+
 # Ensure directories exist
 TRAINING_DIR.mkdir(exist_ok=True)
 OUTPUT_DIR.mkdir(exist_ok=True)
 VALIDATION_DIR.mkdir(exist_ok=True)
 
+def _dump_pickle(obj, path):
+    """Write obj to path using the highest pickle protocol."""
+    # Write to a temp file and swap it in, so an interrupted write never truncates the existing file
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open(mode="wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def _load_pickle(path):
+    """Load a pickle, upgrading it in place if it was written with an older protocol."""
+    with path.open(mode="rb", buffering=PICKLE_BUFFER_SIZE) as f:
+        header = f.peek(2)[:2]
+        data = pickle.load(f)
+    
+    protocol = header[1] if header[:1] == pickle.PROTO else 0
+    if protocol < pickle.HIGHEST_PROTOCOL:
+        try:
+            _dump_pickle(data, path)
+        except Exception as e:
+            print(f"Warning: Could not upgrade {path} to pickle protocol {pickle.HIGHEST_PROTOCOL}: {e}")
+    return data
+
+
+def _encodings_sidecar_paths(encodings_path):
+    """Paths of the .npy matrix and names .json kept next to an encodings pickle."""
+    return encodings_path.with_suffix(".npy"), encodings_path.with_suffix(".names.json")
+
+
+def _write_encodings_sidecar(name_encodings, encodings_path):
+    """
+    Write the encodings as a float16 .npy matrix plus a names .json for memory-mapped loading.
+    
+    Drop every reference to a previously loaded sidecar matrix first: Windows refuses to replace
+    a file that is still mapped, and the mapping only closes once the last reference is gone.
+    """
+    matrix_path, names_path = _encodings_sidecar_paths(encodings_path)
+    # float16 halves the file; rounding moves each value (|x| < 0.5) by at most ~1.2e-4, far below the 0.40
+    # match threshold. Only recognition reads this copy - the pickle keeps the exact float64 values
+    matrix = np.asarray(name_encodings["encodings"], dtype=np.float16).reshape(-1, 128)
+    # Write to temp files and swap them in, so a matrix that is currently mapped is never truncated
+    tmp_matrix_path = matrix_path.with_name(matrix_path.name + ".tmp")
+    with tmp_matrix_path.open(mode="wb") as f:
+        np.save(f, matrix)
+    tmp_names_path = names_path.with_name(names_path.name + ".tmp")
+    with tmp_names_path.open(mode="w", encoding="utf-8") as f:
+        json.dump(list(name_encodings["names"]), f)
+    os.replace(tmp_matrix_path, matrix_path)
+    os.replace(tmp_names_path, names_path)
+
+
+def _load_encodings_sidecar(encodings_path):
+    """Memory-map the sidecar written by _write_encodings_sidecar, or None if it is missing or stale."""
+    matrix_path, names_path = _encodings_sidecar_paths(encodings_path)
+    if not (matrix_path.exists() and names_path.exists()):
+        return None
+    # The pickle is still the source of truth - ignore a sidecar older than it
+    if encodings_path.exists() and min(matrix_path.stat().st_mtime, names_path.stat().st_mtime) < encodings_path.stat().st_mtime:
+        return None
+    with names_path.open(mode="r", encoding="utf-8") as f:
+        names = json.load(f)
+    matrix = np.load(matrix_path, mmap_mode="r")
+    if len(names) != len(matrix):
+        return None
+    return {"names": names, "encodings": matrix}
+
+
+def _copy_files(pairs, progress=None):
+    """
+    Copy (src, dst) pairs concurrently with shutil.copy2; returns the exception (or None) per pair.
+    
+    progress(done) is called, on the calling thread, after each copy in input order.
+    """
+    def copy_one(pair):
+        try:
+            shutil.copy2(*pair)
+            return None
+        except Exception as e:
+            return e
+    
+    errors = []
+    with ThreadPoolExecutor(max_workers=max(1, min(COPY_WORKERS, len(pairs)))) as executor:
+        for error in executor.map(copy_one, pairs):
+            errors.append(error)
+            if progress:
+                progress(len(errors))
+    return errors
+
+
+def _iter_sampled_frames(cap, frame_interval, prefetch=8, rgb=True):
+    """
+    Yield every frame_interval-th frame of cap (RGB, or BGR as decoded if rgb is False),
+    decoding on a background thread.
+    
+    Decoding (which releases the GIL in OpenCV) overlaps with whatever the caller does
+    per frame; at most prefetch frames are buffered. Close the generator to stop early.
+    """
+    frame_q = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    done = object()
+    
+    def put(item):
+        # Give up if the consumer has gone away, so the thread never blocks on a full queue
+        while not stop.is_set():
+            try:
+                frame_q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+    
+    def decode():
+        frame_count = 0
+        try:
+            # grab() advances without converting the frame; only sampled frames are retrieved
+            while cap.grab():
+                if frame_count % frame_interval == 0:
+                    ret, frame = cap.retrieve()
+                    if not ret:
+                        break
+                    if rgb:
+                        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    if not put(frame):
+                        return
+                frame_count += 1
+        except Exception as e:
+            put(e)
+        put(done)
+    
+    decoder = threading.Thread(target=decode, daemon=True)
+    decoder.start()
+    try:
+        while True:
+            item = frame_q.get()
+            if item is done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        decoder.join()
+
+
+# Occurrences of each (label, exception type) reported through _print_throttled
+_error_counts = Counter()
+
+
+def _print_throttled(label, error, every=100):
+    """
+    Print an error raised in a per-frame path the first time and then once every `every` repeats.
+    
+    A camera loop failing on every frame would otherwise format and flush a line per frame.
+    Repeats are counted per label and exception type, so a new kind of failure still shows at once.
+    """
+    key = (label, type(error))
+    _error_counts[key] += 1
+    count = _error_counts[key]
+    if count == 1 or count % every == 0:
+        repeats = f" (seen {count} times)" if count > 1 else ""
+        print(f"{label}: {error}{repeats}")
+
+
+def _ewma(average, sample, weight=0.1):
+    """Exponentially weighted moving average, started at the first sample."""
+    return sample if average is None else average + weight * (sample - average)
+
+
+class _LatestJobWorker:
+    """
+    Run fn(job) on a background thread for the most recently submitted job.
+    
+    submit() never blocks: a job still waiting when a newer one arrives is dropped,
+    so the worker always works on the freshest frame. The last return value is
+    kept in .result for the Tk thread to pick up, and .latency tracks how long
+    jobs take (moving average, seconds) so callers can submit no faster than that.
+    """
+    
+    def __init__(self, fn):
+        self.result = None
+        self.latency = None
+        self._fn = fn
+        self._jobs = queue.Queue(maxsize=1)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def submit(self, job):
+        """Queue job, replacing any job that hasn't started yet."""
+        try:
+            self._jobs.get_nowait()
+        except queue.Empty:
+            pass
+        self._jobs.put_nowait(job)
+    
+    def stop(self, timeout=1.0):
+        """Stop the worker, waiting up to timeout for the current job to finish."""
+        self._stop.set()
+        self._thread.join(timeout)
+    
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                job = self._jobs.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            start = time.perf_counter()
+            try:
+                self.result = self._fn(job)
+            except Exception as e:
+                _print_throttled("Frame processing error", e)
+            self.latency = _ewma(self.latency, time.perf_counter() - start)
+
+
+def _scandir_two_level(root):
+    """Yield (person_entry, file_entry) for every file one folder below root, using cached DirEntry info."""
+    with os.scandir(root) as people:
+        for person_entry in people:
+            if not person_entry.is_dir():
+                continue
+            with os.scandir(person_entry.path) as files:
+                for file_entry in files:
+                    if file_entry.is_file():
+                        yield person_entry, file_entry
+
+
+def _create_detector(model_name):
+    """Create the detector for a model, importing only that backend's framework."""
+    if model_name == "yolov8":
+        from yolov8_detector import YOLOv8FaceDetector
+        return YOLOv8FaceDetector()
+    elif model_name == "yolov11":
+        from yolo_face_detector import YOLOFaceDetector
+        return YOLOFaceDetector()
+    elif model_name == "retinaface":
+        try:
+            from retinaface_detector import RetinaFaceDetector
+            return RetinaFaceDetector()
+        except ImportError:
+            raise ImportError(
+                "RetinaFace is not installed. Please install it with: pip install retina-face"
+            )
+    elif model_name == "deepface":
+        try:
+            from deepface_detector import DeepFaceDetector
+            return DeepFaceDetector()
+        except ImportError:
+            raise ImportError(
+                "DeepFace is not installed. Please install it with: pip install deepface"
+            )
+    raise KeyError(model_name)
+
+
+def _limit_torch_threads(num_threads):
+    """Cap torch's CPU thread pools if a torch-based detector has imported it."""
+    torch = sys.modules.get("torch")
+    if torch is None:
+        return
+    try:
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(num_threads)
+    except RuntimeError:
+        # Inter-op threads can only be set before torch runs any parallel work
+        pass
+
+
+def _open_camera(index):
+    """Open a webcam with OpenCV's internal frame queue cut to one frame so reads are never stale."""
+    # Ask for hardware-accelerated decoding where the backend offers it (MSMF on Windows, FFmpeg
+    # streams); backends that reject the parameter fail to open, so retry without it
+    capture = cv2.VideoCapture(index, cv2.CAP_ANY, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+    if not capture.isOpened():
+        capture = cv2.VideoCapture(index)
+    if capture.isOpened():
+        # Backends that ignore these just return False; the capture still works
+        capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # MJPG keeps USB bandwidth down so the camera can hold its frame rate at higher resolutions
+        capture.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+    return capture
+
+
+def _load_rgb(image_path):
+    """Load an image file as an RGB uint8 array, decoding with OpenCV and falling back to PIL."""
+    # imdecode from a byte buffer (rather than imread) also handles non-ASCII paths on Windows
+    image = cv2.imdecode(np.fromfile(str(image_path), dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is not None:
+        return cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    # Formats OpenCV can't decode (e.g. GIF on older builds)
+    pil_image = Image.open(image_path)
+    if pil_image.mode != 'RGB':
+        pil_image = pil_image.convert('RGB')
+    return np.array(pil_image, dtype=np.uint8)
+
+
+_worker_detector = None  # Per-process detector for training workers, see _init_encode_worker
+
+
+def _init_encode_worker(model_name):
+    """Process pool initializer: load the detector once per training worker."""
+    global _worker_detector
+    # The workers already run in parallel - keep each one single-threaded
+    cv2.setNumThreads(1)
+    _worker_detector = _create_detector(model_name)
+    _limit_torch_threads(1)
+
+
+def _encode_file(path_str, encoding_model):
+    """
+    Detect and encode the faces in one training image (runs in a training worker).
+    
+    Returns (encodings, error); error is None on success or a short reason.
+    """
+    try:
+        image = _load_rgb(path_str)
+        face_locations = _worker_detector.detect_faces(image)
+        if not face_locations:
+            return [], "no face detected"
+        face_encodings = _face_encodings(image, face_locations, model=encoding_model)
+        if not face_encodings:
+            return [], "encoding failed"
+        return face_encodings, None
+    except Exception as e:
+        return [], str(e)
+
+
+def _face_encodings(image, face_locations, model="small"):
+    """
+    Encode every face in an image with a single batched dlib call.
+    
+    face_recognition.face_encodings runs the ResNet once per face; dlib can take
+    all landmark sets at once, so the network runs as one batch. Falls back to
+    face_recognition if its internals aren't available.
+    """
+    if not face_locations:
+        return []
+    try:
+        import dlib
+        from face_recognition import api as face_recognition_api
+        landmarks = face_recognition_api._raw_face_landmarks(image, face_locations, model)
+        shapes = dlib.full_object_detections()
+        for landmark_set in landmarks:
+            shapes.append(landmark_set)
+        descriptors = face_recognition_api.face_encoder.compute_face_descriptor(image, shapes, 1)
+        return [np.array(descriptor) for descriptor in descriptors]
+    except (ImportError, AttributeError, TypeError):
+        return face_recognition.face_encodings(image, face_locations, model=model)
+
+
+def _face_encodings_batch(batch, model="small"):
+    """
+    Encode the faces of several images with one dlib call.
+    
+    batch is a list of (image, face_locations); returns one list of encodings per image.
+    Falls back to encoding image by image if dlib's multi-image API isn't available.
+    """
+    try:
+        import dlib
+        from face_recognition import api as face_recognition_api
+        images = []
+        shape_sets = []
+        for image, face_locations in batch:
+            shapes = dlib.full_object_detections()
+            for landmark_set in face_recognition_api._raw_face_landmarks(image, face_locations, model):
+                shapes.append(landmark_set)
+            images.append(image)
+            shape_sets.append(shapes)
+        descriptors = face_recognition_api.face_encoder.compute_face_descriptor(images, shape_sets, 1)
+        return [[np.array(descriptor) for descriptor in image_descriptors] for image_descriptors in descriptors]
+    except (ImportError, AttributeError, TypeError):
+        return [_face_encodings(image, face_locations, model=model) for image, face_locations in batch]
+
+
+def _encode_jpeg(image, quality):
+    """Encode a BGR image as JPEG bytes, with libjpeg-turbo when PyTurboJPEG is installed."""
+    if _turbojpeg is not None:
+        return _turbojpeg.encode(image, quality=quality)
+    ok, buffer = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    return buffer.tobytes()
+
+
+def _scale_boxes(face_locations, scale):
+    """Scale (top, right, bottom, left) boxes found on a frame resized by scale back to full size, as an int32 (N, 4) array."""
+    boxes = np.asarray(face_locations, dtype=np.float32).reshape(-1, 4)
+    return np.rint(boxes * (1 / scale)).astype(np.int32)
+
+
+# One person's DeepFace result as shown in the live overlay
+AnalysisRow = namedtuple("AnalysisRow", "emotion age gender race")
+
+
+@functools.lru_cache(maxsize=256)
+def _analysis_lines(person_key, row):
+    """Overlay text for one person's AnalysisRow: (name line, detail lines), formatted once per distinct row."""
+    details = [f"  Emotion: {row.emotion}", f"  Age: {row.age}y | Gender: {row.gender}"]
+    # Race (if available)
+    if row.race != 'N/A':
+        details.append(f"  Race: {row.race}")
+    return f"Person: {person_key}", tuple(details)
+
+
+# getTextSize's height depends only on the font and scale, so the name strip under a face box is a fixed height
+NAME_LABEL_HEIGHT = cv2.getTextSize("Ag", cv2.FONT_HERSHEY_DUPLEX, 0.7, 2)[0][1] + 10
+
+
+@functools.lru_cache(maxsize=64)
+def _text_size(text, font, scale, thickness):
+    """cv2.getTextSize's (width, height), measured once per distinct string and font."""
+    return cv2.getTextSize(text, font, scale, thickness)[0]
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_filename(name):
+    """A person's name reduced to letters, digits, '-' and '_' (spaces become '_'), sanitized once per name."""
+    # Keeps non-ASCII letters too (isalnum), which a fixed ASCII translate table would not decide correctly
+    return "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip().replace(' ', '_')
+
+
+def _draw_face_boxes(frame, boxes, names, labels=None, label_height=NAME_LABEL_HEIGHT):
+    """Draw (top, right, bottom, left) face boxes with a name strip along the bottom, green if recognized, red if Unknown.
+
+    Boxes and strips take one polylines/fillPoly call per colour; only the text is drawn face by face.
+    labels overrides the text shown for each face (defaults to names).
+    """
+    names = list(names)
+    boxes = np.asarray(boxes, dtype=np.int32).reshape(-1, 4)[:len(names)]
+    if not len(boxes):
+        return
+    known = np.array([name != "Unknown" for name in names[:len(boxes)]])
+    
+    corners = np.empty((len(boxes), 4, 2), dtype=np.int32)
+    corners[:, :, 0] = boxes[:, [3, 1, 1, 3]]
+    corners[:, :, 1] = boxes[:, [0, 0, 2, 2]]
+    strips = corners.copy()
+    strips[:, :2, 1] = boxes[:, 2:3] - label_height
+    for mask, color in ((known, (0, 255, 0)), (~known, (0, 0, 255))):
+        if mask.any():
+            cv2.polylines(frame, corners[mask], True, color, 3)
+            cv2.fillPoly(frame, strips[mask], color)
+    
+    for (top, right, bottom, left), text in zip(boxes.tolist(), labels or names):
+        cv2.putText(frame, text, (left + 6, bottom - 10), cv2.FONT_HERSHEY_DUPLEX, 0.7, (255, 255, 255), 2)
+
+
+# Every flip/rotate combination is one of these eight orientations, each at most two cv2 calls
+_ORIENTATIONS = (
+    (),
+    (functools.partial(cv2.flip, flipCode=1),),
+    (functools.partial(cv2.flip, flipCode=0),),
+    (functools.partial(cv2.flip, flipCode=-1),),
+    (functools.partial(cv2.rotate, rotateCode=cv2.ROTATE_90_CLOCKWISE),),
+    (functools.partial(cv2.rotate, rotateCode=cv2.ROTATE_90_COUNTERCLOCKWISE),),
+    (cv2.transpose,),
+    (cv2.transpose, functools.partial(cv2.flip, flipCode=-1)),
+)
+
+
+def _orientation_steps(flip_h, flip_v, rotation):
+    """Collapse horizontal flip, vertical flip then rotation into the fewest cv2 calls with the same result."""
+    steps = []
+    if flip_h:
+        steps.append(functools.partial(cv2.flip, flipCode=1))
+    if flip_v:
+        steps.append(functools.partial(cv2.flip, flipCode=0))
+    rotate_code = {90: cv2.ROTATE_90_CLOCKWISE, 180: cv2.ROTATE_180, 270: cv2.ROTATE_90_COUNTERCLOCKWISE}.get(rotation)
+    if rotate_code is not None:
+        steps.append(functools.partial(cv2.rotate, rotateCode=rotate_code))
+    
+    # Run both on a small non-square probe and pick the orientation that lands every pixel in the same place
+    probe = np.arange(6, dtype=np.uint8).reshape(2, 3)
+    target = _apply_steps(probe, steps)
+    for candidate in _ORIENTATIONS:
+        result = _apply_steps(probe, candidate)
+        if result.shape == target.shape and np.array_equal(result, target):
+            return candidate
+    return tuple(steps)
+
+
+def _apply_steps(frame, steps):
+    """Apply a sequence of frame -> frame functions, e.g. from _orientation_steps."""
+    for step in steps:
+        frame = step(frame)
+    return frame
+
+
+def _downscale_to_rgb(frame, scale, interpolation=cv2.INTER_AREA, buffers=None):
+    """
+    Downscale a BGR frame and convert it to RGB for detection, on the GPU via OpenCL if available.
+    
+    buffers is an optional dict the caller keeps between frames; the small BGR and RGB arrays are
+    then reused from it instead of allocated per frame, so the result is only valid until the next call.
+    """
+    if OPENCL_AVAILABLE:
+        try:
+            # One upload, resize + convert on the device, one download of the small frame
+            small = cv2.resize(cv2.UMat(frame), (0, 0), fx=scale, fy=scale, interpolation=interpolation)
+            return cv2.cvtColor(small, cv2.COLOR_BGR2RGB).get()
+        except cv2.error:
+            pass
+    return _bgr_to_rgb(_downscale(frame, scale, interpolation, buffers), buffers)
+
+
+def _downscale(frame, scale, interpolation=cv2.INTER_AREA, buffers=None):
+    """Downscale a BGR frame for detection, into buffers["bgr"] if a buffers dict is given (see _downscale_to_rgb)."""
+    if buffers is None:
+        return cv2.resize(frame, (0, 0), fx=scale, fy=scale, interpolation=interpolation)
+    height, width = frame.shape[:2]
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    shape = (size[1], size[0], 3)
+    if buffers.get("shape") != shape:
+        buffers.update(shape=shape, bgr=np.empty(shape, dtype=np.uint8), rgb=np.empty(shape, dtype=np.uint8))
+    return cv2.resize(frame, size, dst=buffers["bgr"], interpolation=interpolation)
+
+
+def _bgr_to_rgb(small, buffers=None):
+    """Convert a frame from _downscale to RGB, into buffers["rgb"] if a buffers dict is given."""
+    if buffers is None:
+        return cv2.cvtColor(small, cv2.COLOR_BGR2RGB)
+    return cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=buffers["rgb"])
+
+
+def _build_encoding_index(name_encodings):
+    """Stack known encodings into one contiguous float32 matrix for distance lookups."""
+    if not name_encodings or len(name_encodings.get("encodings", [])) == 0:
+        return None
+    # The float16 sidecar matrix is widened once here; distances are always computed in float32.
+    # np.array always copies, so the index never keeps a memory-mapped sidecar (even a float32 one) open
+    matrix = np.array(name_encodings["encodings"], dtype=np.float32, order="C")
+    names = list(name_encodings["names"])
+    # Integer label per row (ids in order of first appearance) so votes can be summed with bincount
+    id_to_name = list(dict.fromkeys(names))
+    name_to_id = {name: i for i, name in enumerate(id_to_name)}
+    return {
+        "matrix": matrix,
+        "sq_norms": np.einsum("ij,ij->i", matrix, matrix),
+        "names": names,
+        "name_ids": np.fromiter((name_to_id[name] for name in names), dtype=np.intp, count=len(names)),
+        "id_to_name": id_to_name,
+    }
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _numba_distances(matrix, query):
+        """Euclidean distance from query to every row of matrix, compiled and run across cores."""
+        distances = np.empty(matrix.shape[0], dtype=np.float32)
+        for i in prange(matrix.shape[0]):
+            total = 0.0
+            for k in range(matrix.shape[1]):
+                diff = matrix[i, k] - query[k]
+                total += diff * diff
+            distances[i] = np.sqrt(total)
+        return distances
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _numba_vote(matrix, name_ids, query, threshold, num_names):
+        """Distance, threshold and inverse-distance vote in one compiled call; returns the best id or -1."""
+        distances = np.empty(matrix.shape[0], dtype=np.float32)
+        for i in prange(matrix.shape[0]):
+            total = 0.0
+            for k in range(matrix.shape[1]):
+                diff = matrix[i, k] - query[k]
+                total += diff * diff
+            distances[i] = np.sqrt(total)
+        votes = np.zeros(num_names, dtype=np.float64)
+        for i in range(matrix.shape[0]):
+            if distances[i] <= threshold:
+                votes[name_ids[i]] += 1.0 / (distances[i] + 0.1)
+        best = -1
+        for j in range(num_names):
+            if votes[j] > 0.0 and (best < 0 or votes[j] > votes[best]):
+                best = j
+        return best
+
+
+def _warm_up_distances():
+    """Compile the numba recognition kernels ahead of the first recognition."""
+    if NUMBA_AVAILABLE:
+        try:
+            matrix = np.zeros((1, 128), dtype=np.float32)
+            query = np.zeros(128, dtype=np.float32)
+            _numba_distances(matrix, query)
+            _numba_vote(matrix, np.zeros(1, dtype=np.intp), query, 0.4, 1)
+        except Exception as e:
+            print(f"Warning: numba distance kernel unavailable: {e}")
+
+
+def _encoding_distances(index, face_encoding):
+    """Euclidean distance from face_encoding to every known encoding in one matmul."""
+    query = np.asarray(face_encoding, dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        return _numba_distances(index["matrix"], query)
+    sq_distances = index["sq_norms"] - 2.0 * (index["matrix"] @ query) + query @ query
+    return np.sqrt(np.maximum(sq_distances, 0.0))
+
+
+def _best_match(index, face_encoding, threshold):
+    """
+    Name with the highest inverse-distance vote among encodings within threshold, or None.
+    
+    Each known encoding within threshold votes 1 / (distance + 0.1) for its person.
+    """
+    query = np.asarray(face_encoding, dtype=np.float32)
+    id_to_name = index["id_to_name"]
+    if NUMBA_AVAILABLE:
+        best_id = _numba_vote(index["matrix"], index["name_ids"], query, threshold, len(id_to_name))
+        return id_to_name[best_id] if best_id >= 0 else None
+    
+    return _vote(index, _encoding_distances(index, query), threshold)
+
+
+def _vote(index, face_distances, threshold):
+    """The _best_match vote for one face, given its distances to every known encoding."""
+    matches = face_distances <= threshold
+    if not matches.any():
+        return None
+    # Sum the votes per person in one pass
+    id_to_name = index["id_to_name"]
+    totals = np.bincount(
+        index["name_ids"][matches], weights=1.0 / (face_distances[matches] + 0.1), minlength=len(id_to_name)
+    )
+    return id_to_name[int(totals.argmax())]
+
+
+def _encoding_distance_matrix(index, face_encodings):
+    """Distances from each of several face encodings (rows) to every known encoding, as one GEMM."""
+    queries = np.asarray(face_encodings, dtype=np.float32).reshape(-1, index["matrix"].shape[1])
+    sq_distances = (
+        index["sq_norms"][None, :]
+        + np.einsum("ij,ij->i", queries, queries)[:, None]
+        - 2.0 * (queries @ index["matrix"].T)
+    )
+    return np.sqrt(np.maximum(sq_distances, 0.0))
+
+
+def _best_matches(index, face_encodings, threshold):
+    """_best_match for every face in a frame, with all the distances from a single matrix multiply."""
+    if len(face_encodings) < 2:
+        return [_best_match(index, face_encoding, threshold) for face_encoding in face_encodings]
+    return [_vote(index, row, threshold) for row in _encoding_distance_matrix(index, face_encodings)]
+
+
+@functools.lru_cache(maxsize=None)
+def _probe_module(name):
+    """
+    Check whether an optional package is installed without importing it.
+    
+    Returns (available, error). Uses find_spec so heavy packages (TensorFlow via
+    retinaface/deepface) are never imported just to find out if they exist.
+    """
+    try:
+        if importlib.util.find_spec(name) is None:
+            return False, f"No module named '{name}'"
+    except (ImportError, ValueError) as e:
+        return False, f"{type(e).__name__}: {str(e)}"
+    
+    # retina-face needs the separate tf-keras package on TensorFlow 2.16+
+    if name == "retinaface" and importlib.util.find_spec("tf_keras") is None:
+        try:
+            tf_version = importlib.metadata.version("tensorflow")
+            major, minor = (int(part) for part in tf_version.split(".")[:2])
+            if (major, minor) >= (2, 16):
+                return False, "RetinaFace requires tf-keras with TensorFlow 2.16+ (pip install tf-keras)"
+        except (importlib.metadata.PackageNotFoundError, ValueError):
+            pass
+    return True, None
+
+
 # Modern Minimal Dark Theme Colors
 COLORS = {
     "bg_primary": "#0f0f0f",      # Pure dark background
@@ -84,8 +856,131 @@ COLORS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _tk_font(size, weight="normal"):
+    """Shared Tk font for the UI family, created once per size/weight (needs the Tk root)."""
+    return tkfont.Font(family="Segoe UI", size=size, weight=weight)
+
+
+def _hex_to_rgb(hex_color):
+    """Convert hex color to RGB tuple."""
+    hex_color = hex_color.lstrip('#')
+    return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+
+
+@functools.lru_cache(maxsize=32)
+def _get_font(font_size):
+    """Load the button font for a size once and reuse it."""
+    # Try different font paths
+    font_paths = [
+        "C:/Windows/Fonts/segoeui.ttf",
+        "C:/Windows/Fonts/segoeuib.ttf",  # Bold version
+        "C:/Windows/Fonts/arial.ttf",
+        "C:/Windows/Fonts/arialbd.ttf",  # Bold version
+    ]
+    
+    for font_path in font_paths:
+        try:
+            return ImageFont.truetype(font_path, font_size)
+        except:
+            continue
+    
+    try:
+        return ImageFont.load_default()
+    except:
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def _measure_text(text, font_size):
+    """Measure text rendered with the button font, cached per (text, size)."""
+    font = _get_font(font_size)
+    try:
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+    except:
+        # Fallback if getbbox fails
+        return len(text) * font_size // 2, font_size
+
+
+def _add_text_with_glow(text, width, height, font_size, text_rgb):
+    """Create text image with glow effect."""
+    # Create larger temporary image for glow effect
+    padding = 20  # Extra space for glow
+    temp_img = Image.new('RGBA', (width + padding * 2, height + padding * 2), (0, 0, 0, 0))
+    
+    font = _get_font(font_size)
+    
+    if font is None:
+        # Fallback: just return empty image
+        return temp_img
+    
+    # Get text dimensions
+    text_width, text_height = _measure_text(text, font_size)
+    
+    # Calculate position (centered)
+    x = (width + padding * 2 - text_width) // 2
+    y = (height + padding * 2 - text_height) // 2
+    
+    # Draw the text once into an alpha mask and blur it for the glow
+    glow_intensity = 5
+    glow_alpha = Image.new('L', temp_img.size, 0)
+    ImageDraw.Draw(glow_alpha).text((x, y), text, font=font, fill=255)
+    glow_alpha = glow_alpha.filter(ImageFilter.GaussianBlur(radius=glow_intensity))
+    glow_alpha = glow_alpha.point(lambda v: int(v * 0.3))
+    channels = [Image.new('L', temp_img.size, c) for c in text_rgb]
+    temp_img = Image.merge('RGBA', (*channels, glow_alpha))
+    temp_draw = ImageDraw.Draw(temp_img)
+    
+    # Draw main text (white, full opacity)
+    temp_draw.text((x, y), text, font=font, fill=(*text_rgb, 255))
+    
+    return temp_img
+
+
+@functools.lru_cache(maxsize=64)
+def _rounded_mask(size, rect, radius):
+    """Alpha mask of a rounded rectangle, cached per shape since only the fill color varies."""
+    mask = Image.new('L', size, 0)
+    ImageDraw.Draw(mask).rounded_rectangle(rect, radius=radius, fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=512)
+def _render_button(text, width, height, bg_rgb, radius, font_size, text_rgb):
+    """
+    Render a ModernButton face and return it as raw RGBA bytes plus size.
+    
+    Cached at module level so identical buttons (and repeated resizes to the
+    same size) share one render. Raw bytes are cached rather than a
+    PhotoImage because PhotoImage is bound to a Tk interpreter.
+    """
+    # Background color, cut to the rounded shape (mask is shared across colors)
+    img = Image.new('RGBA', (width, height), (*bg_rgb, 255))
+    img.putalpha(_rounded_mask((width, height), (0, 0, width, height), radius))
+    
+    # Subtle inner highlight (top edge)
+    highlight_rgb = tuple(min(255, c + 15) for c in bg_rgb)
+    highlight_mask = _rounded_mask((width, 3), (0, 0, width, 2), radius)
+    img.paste((*highlight_rgb, 100), (0, 0, width, 3), highlight_mask)
+    
+    # Add text with glow
+    text_img = _add_text_with_glow(text, width, height, font_size, text_rgb)
+    
+    # Composite text onto button
+    text_x = (width - text_img.width) // 2
+    text_y = (height - text_img.height) // 2
+    img.paste(text_img, (text_x, text_y), text_img)
+    
+    return img.tobytes(), img.size
+
+
 class ModernButton(tk.Button):
     """Modern minimalistic button with smooth hover effects."""
+    # Widget sizes are snapped down to this many pixels so that small resize
+    # jitter still hits the render cache
+    SIZE_BUCKET = 8
+    
     def __init__(self, parent, **kwargs):
         # Extract button properties
         self.button_text = kwargs.get('text', 'Button')
@@ -108,6 +1003,9 @@ class ModernButton(tk.Button):
         
         self.radius = 8  # Subtle rounded corners
         
+        # Pending debounced resize callback
+        self._resize_job = None
+        
         # Remove custom properties from kwargs
         for key in ['text', 'bg', 'fg', 'font', 'width', 'height', 'pady', 'padx']:
             kwargs.pop(key, None)
@@ -130,24 +1028,11 @@ class ModernButton(tk.Button):
         super().__init__(parent, **kwargs)
         
         # Create button images immediately
-        self.default_image = self._create_button_image(self.bg_color)
-        self.hover_image = self._create_button_image(self.hover_bg)
-        self.active_image = self._create_button_image(self.active_bg)
+        self._refresh_images()
         
         # Set initial image and text
         self.config(image=self.default_image, compound='center', text='')
         
-        # Update images when widget is resized
-        self.bind("<Configure>", self._on_configure)
-    
-    def _on_configure(self, e):
-        """Recreate images when widget is resized."""
-        if e.width > 1 and e.height > 1:  # Only if actually sized
-            self.default_image = self._create_button_image(self.bg_color)
-            self.hover_image = self._create_button_image(self.hover_bg)
-            self.active_image = self._create_button_image(self.active_bg)
-            self.config(image=self.default_image)
-        
         # Bind events
         self.bind("<Enter>", self.on_enter)
         self.bind("<Leave>", self.on_leave)
@@ -157,11 +1042,32 @@ class ModernButton(tk.Button):
         # Set command
         if self.command:
             self.config(command=self.command)
+        
+        # Update images when widget is resized
+        self.bind("<Configure>", self._on_configure)
+    
+    def _on_configure(self, e):
+        """Recreate images when widget is resized (debounced)."""
+        if e.width > 1 and e.height > 1:  # Only if actually sized
+            if self._resize_job is not None:
+                self.after_cancel(self._resize_job)
+            self._resize_job = self.after(50, self._on_resize_settled)
+    
+    def _on_resize_settled(self):
+        """Apply the latest size once a burst of <Configure> events settles."""
+        self._resize_job = None
+        self._refresh_images()
+        self.config(image=self.default_image)
+    
+    def _refresh_images(self):
+        """Rebuild the default/hover/active images for the current size."""
+        self.default_image = self._create_button_image(self.bg_color)
+        self.hover_image = self._create_button_image(self.hover_bg)
+        self.active_image = self._create_button_image(self.active_bg)
     
     def _hex_to_rgb(self, hex_color):
         """Convert hex color to RGB tuple."""
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return _hex_to_rgb(hex_color)
     
     def _create_button_image(self, bg_color):
         """Create modern minimalistic button image that fills the widget."""
@@ -182,109 +1088,24 @@ class ModernButton(tk.Button):
                 widget_width = len(self.button_text) * 9 + 60
             widget_height = self.button_height
         
-        # Use full widget size (fill the container)
-        width = max(widget_width, 100)
-        height = max(widget_height, 40)
-        
-        # Create base image with transparent background
-        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(img)
-        
-        # Main button rectangle - fill entire image
-        button_rect = [0, 0, width, height]
-        
-        # Background color with subtle gradient
-        bg_rgb = self._hex_to_rgb(bg_color)
-        draw.rounded_rectangle(button_rect, radius=self.radius, fill=(*bg_rgb, 255))
-        
-        # Subtle inner highlight (top edge)
-        highlight_rect = [0, 0, width, 2]
-        highlight_rgb = tuple(min(255, c + 15) for c in bg_rgb)
-        draw.rounded_rectangle(highlight_rect, radius=self.radius, fill=(*highlight_rgb, 100))
-        
-        # Add text with glow
-        text_img = self._add_text_with_glow(self.button_text, width, height)
-        
-        # Composite text onto button
-        text_x = (width - text_img.width) // 2
-        text_y = (height - text_img.height) // 2
-        img.paste(text_img, (text_x, text_y), text_img)
+        # Use full widget size (fill the container), snapped down to a bucket
+        bucket = self.SIZE_BUCKET
+        width = max(widget_width // bucket * bucket, 100)
+        height = max(widget_height // bucket * bucket, 40)
+        
+        font_size = self.button_font.cget("size") if isinstance(self.button_font, tkfont.Font) else self.button_font[1]
+        data, size = _render_button(
+            self.button_text,
+            width,
+            height,
+            _hex_to_rgb(bg_color),
+            self.radius,
+            font_size,
+            _hex_to_rgb(self.text_color),
+        )
         
         # Convert to PhotoImage
-        return ImageTk.PhotoImage(img)
-    
-    def _add_text_with_glow(self, text, width, height):
-        """Create text image with glow effect."""
-        # Create larger temporary image for glow effect
-        padding = 20  # Extra space for glow
-        temp_img = Image.new('RGBA', (width + padding * 2, height + padding * 2), (0, 0, 0, 0))
-        temp_draw = ImageDraw.Draw(temp_img)
-        
-        # Font size
-        font_size = self.button_font[1]
-        font = None
-        
-        # Try different font paths
-        font_paths = [
-            "C:/Windows/Fonts/segoeui.ttf",
-            "C:/Windows/Fonts/segoeuib.ttf",  # Bold version
-            "C:/Windows/Fonts/arial.ttf",
-            "C:/Windows/Fonts/arialbd.ttf",  # Bold version
-        ]
-        
-        for font_path in font_paths:
-            try:
-                font = ImageFont.truetype(font_path, font_size)
-                break
-            except:
-                continue
-        
-        if font is None:
-            try:
-                font = ImageFont.load_default()
-            except:
-                font = None
-        
-        if font is None:
-            # Fallback: just return empty image
-            return temp_img
-        
-        # Get text dimensions
-        try:
-            bbox = temp_draw.textbbox((0, 0), text, font=font)
-            text_width = bbox[2] - bbox[0]
-            text_height = bbox[3] - bbox[1]
-        except:
-            # Fallback if textbbox fails
-            text_width = len(text) * font_size // 2
-            text_height = font_size
-        
-        # Calculate position (centered)
-        x = (width + padding * 2 - text_width) // 2
-        y = (height + padding * 2 - text_height) // 2
-        
-        text_rgb = self._hex_to_rgb(self.text_color)
-        
-        # Draw glow layers (multiple layers with increasing blur effect)
-        glow_intensity = 5
-        for i in range(glow_intensity, 0, -1):
-            # Create glow layer with reduced opacity
-            alpha = int(30 * (i / glow_intensity))
-            glow_color = (*text_rgb, alpha)
-            
-            # Draw multiple offset copies for glow effect
-            offsets = [
-                (x - i, y - i), (x, y - i), (x + i, y - i),
-                (x - i, y), (x + i, y),
-                (x - i, y + i), (x, y + i), (x + i, y + i)
-            ]
-            for offset_x, offset_y in offsets:
-                temp_draw.text((offset_x, offset_y), text, font=font, fill=glow_color)
-        
-        # Draw main text (white, full opacity)
-        temp_draw.text((x, y), text, font=font, fill=(*text_rgb, 255))
-        
-        return temp_img
+        return ImageTk.PhotoImage(Image.frombytes('RGBA', size, data))
     
     def on_enter(self, e):
         """Handle mouse enter - show hover state."""
@@ -379,7 +1200,7 @@ class CustomDropdown(tk.Frame):
             text="▼",
             bg=self.bg_color,
             fg=self.text_color,
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             padx=5
         )
         self.canvas.create_window(self.width - 15, 17, window=self.arrow_label, anchor="e")
@@ -387,9 +1208,15 @@ class CustomDropdown(tk.Frame):
         # Update canvas on resize
         self.canvas.bind("<Configure>", lambda e: self._draw_rounded_frame())
         
-        # Options listbox (initially hidden)
+        # Options popup (prebuilt and hidden) so opening the dropdown
+        # doesn't repack the parent layout
+        self._popup = tk.Toplevel(self)
+        self._popup.overrideredirect(True)
+        self._popup.withdraw()
+        
+        # Options listbox
         self.options_listbox = tk.Listbox(
-            self,
+            self._popup,
             bg=self.bg_color,
             fg=self.text_color,
             font=self.font,
@@ -401,6 +1228,8 @@ class CustomDropdown(tk.Frame):
             activestyle='none'
         )
         
+        self.options_listbox.pack(fill=tk.BOTH, expand=True)
+        
         # Add values to listbox
         for value in self.values:
             self.options_listbox.insert(tk.END, value)
@@ -417,6 +1246,10 @@ class CustomDropdown(tk.Frame):
     
     def _draw_rounded_frame(self):
         """Draw rounded rectangle on canvas."""
+        # The shape only depends on the width, so resizes that keep it are no-ops
+        if getattr(self, "_last_width", None) == self.width:
+            return
+        self._last_width = self.width
         self.canvas.delete("rounded_bg")
         # Draw rounded rectangle (simulated with multiple rectangles)
         self.canvas.create_rectangle(
@@ -451,16 +1284,18 @@ class CustomDropdown(tk.Frame):
         """Open the dropdown."""
         self.is_open = True
         self.arrow_label.config(text="▲")
-        # Show listbox below canvas
-        self.options_listbox.pack(fill=tk.X, pady=(3, 0))
+        # Show popup below canvas
         self.options_listbox.config(height=min(len(self.values), 5))  # Show max 5 items
-        self.update_idletasks()
+        height = self.options_listbox.winfo_reqheight()
+        self._popup.geometry(f"{self.width}x{height}+{self.winfo_rootx()}+{self.winfo_rooty() + 38}")
+        self._popup.deiconify()
+        self._popup.lift()
     
     def _close_dropdown(self):
         """Close the dropdown."""
         self.is_open = False
         self.arrow_label.config(text="▼")
-        self.options_listbox.pack_forget()
+        self._popup.withdraw()
     
     def _on_listbox_select(self, e):
         """Handle listbox selection."""
@@ -533,31 +1368,60 @@ class FaceRecognitionApp:
         self.camera_index = tk.IntVar(value=0)
         self.camera_running = False
         self.video_capture = None
+        self._frame_q = None  # Latest frames from the camera reader thread
+        self._frame_reader = None
+        self._inference_worker = None  # Detection/recognition worker for the open camera window
+        self._deepface_pool = None  # DeepFace analysis runs here so it never stalls detection
         self.video_processing = False
         self.camera_flip_horizontal = tk.BooleanVar(value=False)
         self.camera_flip_vertical = tk.BooleanVar(value=False)
         self.camera_rotate = tk.IntVar(value=0)  # 0, 90, 180, 270 degrees
+        self.detect_scale = tk.DoubleVar(value=0.4)  # Frame downscale before detection (lower = faster)
+        self.detect_every = tk.IntVar(value=3)  # Run detection on every Nth camera frame, reuse boxes in between
+        # Plain-attribute copies of the settings the camera loops read every frame (var.get() is a Tcl round-trip)
+        self._orientation = ()  # Flip/rotate as at most two cv2 calls, see _update_orientation
+        self._update_orientation()
+        for var in (self.camera_flip_horizontal, self.camera_flip_vertical, self.camera_rotate):
+            var.trace_add('write', self._update_orientation)
+        self._mirror_var(self.detection_model, "_model_name")
+        self._mirror_var(self.model_type, "_encoding_model", lambda: "small" if self.model_type.get() == "hog" else "large")
+        self._mirror_var(self.detect_scale, "_detect_scale", self._read_detect_scale)
+        self._mirror_var(self.detect_every, "_detect_every", self._read_detect_every)
         
         # Gemini Live API
         self.gemini_api_key = tk.StringVar(value="")
         self.gemini_live_api: Optional[GeminiLiveAPI] = None
         self.live_api_enabled = False
-        self.load_gemini_api_key()
+        # Read the saved key off the main thread so the window paints straight away
+        threading.Thread(target=self._async_load_gemini_key, daemon=True).start()
         
         # Model-specific data
         self.loaded_encodings = {}  # Dict: {model_name: encodings}
-        self.processed_files = {}  # Dict: {model_name: set of files}
-        self.detectors = {}  # Cache detectors
-        
-        # DeepFace calibration
+        self.encoding_index = {}  # Dict: {model_name: stacked encodings, see _build_encoding_index}
+        self._people_counts = {}  # Dict: {model_name: distinct people}, reset when encodings change
+        self._people_entries = ()  # Rows currently shown in people_listbox, see update_people_list
+        self.processed_files = {}  # Dict: {model_name: {file_key: mtime when trained}}
+        # Compile the optional numba kernel in the background so the first frame doesn't pay for it
+        if NUMBA_AVAILABLE:
+            threading.Thread(target=_warm_up_distances, daemon=True).start()
+        self._model_change_pending = None  # after() id of the debounced model change
+        self._traces = {}  # detection_model trace ids by key, see _trace_detection_model
+        self._dialog = None  # Reused message dialog, see _show_dialog
+        self._pages = {}  # Built pages by name, see _show_page
+        self._current_page = None
+        self.detectors = weakref.WeakValueDictionary()  # Cache detectors (only the active one is kept alive)
+        self._detectors_lock = threading.Lock()  # Guards self.detectors across the Tk and model threads
+        self._model_executor = ThreadPoolExecutor(max_workers=1)  # Model load/unload work off the Tk thread
+        self._active_detector = None  # Strong reference to the selected model's detector
+        
+        # DeepFace calibration (created on first use, see _get_calibrator)
         self.deepface_calibrator = None
-        try:
-            self.deepface_calibrator = DeepFaceCalibrator()
-        except Exception as e:
-            print(f"Warning: Could not initialize DeepFace calibrator: {e}")
+        self._calibration_running = False
+        self._calibrator_loaded = False
         
         # Smart Attendance tracking
         self.seen_today = set()  # Track students marked present today
+        self._attendance_lock = threading.Lock()  # Guards seen_today against the attendance inference worker
         self.attendance_date = None  # Track the date for automatic reset
         
         # Load encodings for all models
@@ -610,6 +1474,26 @@ class FaceRecognitionApp:
             darkcolor=[('focus', COLORS['accent_blue'])]
         )
     
+    def _register_card_options(self):
+        """Register option-database defaults for the homepage card grid (widgets under .home_cards)."""
+        options = {
+            "*home_cards.Frame.background": COLORS["bg_secondary"],
+            "*home_cards.Frame.relief": tk.FLAT,
+            "*home_cards.Frame.borderWidth": 0,
+            "*home_cards*Button.background": COLORS["bg_tertiary"],
+            "*home_cards*Button.foreground": COLORS["text_primary"],
+            "*home_cards*Button.font": "{Segoe UI} 13 bold",
+            "*home_cards*Button.relief": tk.FLAT,
+            "*home_cards*Button.cursor": "hand2",
+            "*home_cards*Button.padX": 20,
+            "*home_cards*Button.padY": 12,
+            "*home_cards*Label.background": COLORS["bg_secondary"],
+            "*home_cards*Label.foreground": COLORS["text_tertiary"],
+            "*home_cards*Label.font": "{Segoe UI} 10",
+        }
+        for pattern, value in options.items():
+            self.root.option_add(pattern, value)
+    
     def center_window(self):
         """Center the window on the screen."""
         self.root.update_idletasks()
@@ -621,29 +1505,67 @@ class FaceRecognitionApp:
     
     def load_all_encodings(self):
         """Load face encodings for all models."""
-        for model_name, encodings_path in ENCODINGS_PATHS.items():
-            try:
-                if encodings_path.exists():
-                    with encodings_path.open(mode="rb") as f:
-                        self.loaded_encodings[model_name] = pickle.load(f)
-                else:
-                    self.loaded_encodings[model_name] = None
-            except Exception as e:
-                print(f"Error loading encodings for {model_name}: {e}")
-                self.loaded_encodings[model_name] = None
+        # Each model has its own file, so load them in parallel and assign once
+        with ThreadPoolExecutor(max_workers=len(ENCODINGS_PATHS)) as executor:
+            results = dict(zip(ENCODINGS_PATHS, executor.map(self._load_one_encodings, ENCODINGS_PATHS)))
+        self.loaded_encodings.update(results)
+        for model_name in results:
+            self._index_encodings(model_name)
+    
+    def _load_one_encodings(self, model_name):
+        """Load the face encodings file for a single model (None if missing or unreadable)."""
+        encodings_path = ENCODINGS_PATHS[model_name]
+        try:
+            name_encodings = _load_encodings_sidecar(encodings_path)
+            if name_encodings is not None:
+                return name_encodings
+        except Exception as e:
+            print(f"Error loading encodings sidecar for {model_name}: {e}")
+        try:
+            if encodings_path.exists():
+                name_encodings = _load_pickle(encodings_path)
+                # Migrate to the memory-mappable format so the next start skips unpickling
+                try:
+                    _write_encodings_sidecar(name_encodings, encodings_path)
+                except Exception as e:
+                    print(f"Warning: Could not write encodings sidecar for {model_name}: {e}")
+                return name_encodings
+        except Exception as e:
+            print(f"Error loading encodings for {model_name}: {e}")
+        return None
+    
+    def _index_encodings(self, model_name):
+        """Rebuild the stacked encoding matrix used for recognition."""
+        self._people_counts.pop(model_name, None)
+        try:
+            self.encoding_index[model_name] = _build_encoding_index(self.loaded_encodings.get(model_name))
+        except Exception as e:
+            print(f"Error indexing encodings for {model_name}: {e}")
+            self.encoding_index[model_name] = None
     
     def load_all_processed_files(self):
         """Load processed files for all models."""
-        for model_name, processed_path in PROCESSED_FILES_PATHS.items():
-            try:
-                if processed_path.exists():
-                    with processed_path.open(mode="rb") as f:
-                        self.processed_files[model_name] = pickle.load(f)
-                else:
-                    self.processed_files[model_name] = set()
-            except Exception as e:
-                print(f"Error loading processed files for {model_name}: {e}")
-                self.processed_files[model_name] = set()
+        with ThreadPoolExecutor(max_workers=len(PROCESSED_FILES_PATHS)) as executor:
+            results = dict(zip(PROCESSED_FILES_PATHS, executor.map(self._load_one_processed_files, PROCESSED_FILES_PATHS)))
+        self.processed_files.update(results)
+    
+    def _load_one_processed_files(self, model_name):
+        """Load {file_key: mtime} of trained files for a single model (empty if missing or unreadable)."""
+        processed_path = PROCESSED_FILES_PATHS[model_name]
+        try:
+            if processed_path.exists():
+                processed = _load_pickle(processed_path)
+                if isinstance(processed, set):
+                    # Older files only listed names; take the current mtimes as the trained ones
+                    processed = {
+                        file_key: (TRAINING_DIR / file_key).stat().st_mtime
+                        for file_key in processed
+                        if (TRAINING_DIR / file_key).exists()
+                    }
+                return processed
+        except Exception as e:
+            print(f"Error loading processed files for {model_name}: {e}")
+        return {}
     
     def save_processed_files(self, model_name=None):
         """Save list of processed files for a specific model."""
@@ -652,8 +1574,7 @@ class FaceRecognitionApp:
         
         try:
             processed_path = PROCESSED_FILES_PATHS[model_name]
-            with processed_path.open(mode="wb") as f:
-                pickle.dump(self.processed_files.get(model_name, set()), f)
+            _dump_pickle(self.processed_files.get(model_name, {}), processed_path)
         except Exception as e:
             print(f"Error saving processed files for {model_name}: {e}")
     
@@ -665,46 +1586,72 @@ class FaceRecognitionApp:
     def get_current_processed_files(self):
         """Get processed files for current detection model."""
         model_name = self.detection_model.get()
-        return self.processed_files.get(model_name, set())
+        return self.processed_files.get(model_name, {})
     
-    def get_detector(self):
-        """Get detector for current model. Only loads the selected model."""
-        model_name = self.detection_model.get()
-        
-        # Only load the selected model (unloading is handled in on_model_change)
-        if model_name not in self.detectors:
-            if model_name == "yolov8":
-                self.detectors[model_name] = YOLOv8FaceDetector()
-            elif model_name == "yolov11":
-                self.detectors[model_name] = YOLOFaceDetector()
-            elif model_name == "retinaface":
-                try:
-                    self.detectors[model_name] = RetinaFaceDetector()
-                except ImportError:
-                    raise ImportError(
-                        "RetinaFace is not installed. Please install it with: pip install retina-face"
-                    )
-            elif model_name == "deepface":
-                try:
-                    self.detectors[model_name] = DeepFaceDetector()
-                except ImportError:
-                    raise ImportError(
-                        "DeepFace is not installed. Please install it with: pip install deepface"
-                    )
+    def get_detector(self, model_name=None):
+        """Get detector for current model (or model_name). Only loads the selected model."""
+        if model_name is None:
+            model_name = self.detection_model.get()
         
-        return self.detectors[model_name]
+        # Only load the selected model (unloading is handled in on_model_change).
+        # Detector modules are imported here so only the selected backend's
+        # framework is ever loaded.
+        with self._detectors_lock:
+            detector = self.detectors.get(model_name)
+        if detector is None:
+            detector = _create_detector(model_name)
+            with self._detectors_lock:
+                self.detectors[model_name] = detector
+            self._limit_torch_threads()
+        
+        self._active_detector = detector
+        return detector
+    
+    def _limit_torch_threads(self):
+        """Cap torch's CPU thread pools once a torch-based detector has imported it."""
+        _limit_torch_threads(TORCH_THREADS)
+    
+    def _get_calibrator(self):
+        """Get the DeepFace calibrator, creating it on first use."""
+        if not self._calibrator_loaded:
+            self._calibrator_loaded = True
+            try:
+                from deepface_calibration import DeepFaceCalibrator
+                self.deepface_calibrator = DeepFaceCalibrator()
+            except Exception as e:
+                print(f"Warning: Could not initialize DeepFace calibrator: {e}")
+        return self.deepface_calibrator
     
-    def clear_frame(self):
-        """Clear all widgets from the main frame."""
-        for widget in self.root.winfo_children():
-            widget.destroy()
+    def _show_page(self, name, builder, on_show=None):
+        """
+        Hide the current page and show the named one.
+        
+        The page frame is built by builder(page) on the first visit and kept;
+        later visits re-pack it and call on_show() to refresh dynamic content.
+        """
+        if self._current_page is not None:
+            self._pages[self._current_page].pack_forget()
+        self._current_page = name
+        
+        page = self._pages.get(name)
+        if page is None:
+            page = tk.Frame(self.root, bg=COLORS["bg_primary"])
+            self._pages[name] = page
+            page.pack(fill=tk.BOTH, expand=True)
+            builder(page)
+        else:
+            page.pack(fill=tk.BOTH, expand=True)
+            if on_show:
+                on_show()
     
     def create_homepage(self):
+        """Show the main homepage, building it on first use."""
+        self._show_page("home", self._build_homepage, on_show=self._update_homepage_status)
+    
+    def _build_homepage(self, page):
         """Create the main homepage with modern dark theme."""
-        self.clear_frame()
-        
         # Header with gradient effect
-        header_frame = tk.Frame(self.root, bg=COLORS["bg_secondary"], height=120)
+        header_frame = tk.Frame(page, bg=COLORS["bg_secondary"], height=120)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
         
@@ -715,14 +1662,14 @@ class FaceRecognitionApp:
         title_label = tk.Label(
             title_container,
             text="Face Recognition System",
-            font=("Segoe UI", 36, "bold"),
+            font=_tk_font(36, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         )
         title_label.pack()
         
         # Main content frame
-        content_frame = tk.Frame(self.root, bg=COLORS["bg_primary"])
+        content_frame = tk.Frame(page, bg=COLORS["bg_primary"])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
         
         # Model Selection Card
@@ -740,26 +1687,14 @@ class FaceRecognitionApp:
         tk.Label(
             model_header,
             text="Detection Model",
-            font=("Segoe UI", 13, "bold"),
+            font=_tk_font(13, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(side=tk.LEFT, padx=(0, 12))
         
-        # Check if RetinaFace is available
-        retinaface_available = False
-        try:
-            import retinaface
-            retinaface_available = True
-        except:
-            pass
-        
-        # Check if DeepFace is available
-        deepface_available = False
-        try:
-            import deepface
-            deepface_available = True
-        except:
-            pass
+        # Check which optional backends are installed (without importing them)
+        retinaface_available, _ = _probe_module("retinaface")
+        deepface_available, _ = _probe_module("deepface")
         
         model_options_home = ["yolov11", "yolov8"]
         if retinaface_available:
@@ -781,7 +1716,7 @@ class FaceRecognitionApp:
         model_desc_home = tk.Label(
             model_header,
             text="",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_tertiary"]
         )
@@ -789,19 +1724,11 @@ class FaceRecognitionApp:
         
         def update_home_model_desc(*args):
             model_name = self.detection_model.get()
-            desc_map = {
-                "yolov11": "Latest YOLO, best accuracy",
-                "yolov8": "Stable YOLO version",
-                "retinaface": "Deep learning with landmarks",
-                "deepface": "Face recognition + Emotion/Age/Race/Gender"
-            }
-            model_desc_home.config(text=desc_map.get(model_name, ""))
-            # Unload other models
-            self.root.after_idle(lambda: self._unload_other_models(model_name))
-            # Update status
-            self.root.after(100, lambda: self._update_homepage_status())
-        
-        self.detection_model.trace('w', update_home_model_desc)
+            model_desc_home.config(text=MODEL_DESCRIPTIONS.get(model_name, ""))
+            # Unload other models and update status (coalesced across all model traces)
+            self._schedule_model_change()
+        
+        self._trace_detection_model("home_model_desc", update_home_model_desc)
         update_home_model_desc()
         
         # Status card with modern design
@@ -820,7 +1747,7 @@ class FaceRecognitionApp:
         tk.Label(
             status_header,
             text="System Status",
-            font=("Segoe UI", 15, "bold"),
+            font=_tk_font(15, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(side=tk.LEFT)
@@ -832,7 +1759,7 @@ class FaceRecognitionApp:
         self.status_label = tk.Label(
             status_body,
             text="",
-            font=("Segoe UI", 11),
+            font=_tk_font(11),
             bg=COLORS["bg_secondary"],
             fg=COLORS["success"],
             anchor="w"
@@ -843,7 +1770,10 @@ class FaceRecognitionApp:
         self._update_homepage_status()
         
         # Buttons grid with modern cards
-        buttons_container = tk.Frame(content_frame, bg=COLORS["bg_primary"])
+        # Card widgets take their colors/fonts from the option database (one lookup per widget
+        # instead of passing every option to each Frame/Button/Label)
+        self._register_card_options()
+        buttons_container = tk.Frame(content_frame, name="home_cards", bg=COLORS["bg_primary"])
         buttons_container.pack(fill=tk.BOTH, expand=True)
         
         # Create button cards
@@ -851,86 +1781,58 @@ class FaceRecognitionApp:
             {
                 "text": "Train Model",
                 "command": self.show_training_page,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Add people and train recognition"
             },
             {
                 "text": "Live Recognition",
                 "command": self.start_live_recognition,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Real-time camera recognition"
             },
             {
                 "text": "Test Image",
                 "command": self.test_image,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Test on uploaded images"
             },
             {
                 "text": "DeepFace Calibration",
                 "command": self.show_deepface_calibration_page,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Improve emotion, age, race accuracy"
             },
             {
                 "text": "View People",
                 "command": self.view_registered_people,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Browse registered people"
             },
             {
                 "text": "Settings",
                 "command": self.show_settings,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Configure system settings"
             },
             {
                 "text": "Smart Attendance",
                 "command": self.start_smart_attendance,
-                "color": COLORS["bg_tertiary"],
                 "desc": "Mark attendance in Google Sheet"
             },
         ]
         
-        # Create button grid
+        # Create button grid as one Tcl script (a single Python->Tcl call instead of ~6 per card);
+        # only the button commands need to be registered as Python callbacks
+        script = []
         for i, btn_info in enumerate(buttons):
             row = i // 2
             col = i % 2
-            
-            # Card frame
-            card = tk.Frame(
-                buttons_container,
-                bg=COLORS["bg_secondary"],
-                relief=tk.FLAT,
-                bd=0
-            )
-            card.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
-            card.grid_columnconfigure(0, weight=1)
-            
-            # Button
-            btn = tk.Button(
-                card,
-                text=btn_info["text"],
-                bg=btn_info["color"],
-                fg=COLORS["text_primary"],
-                command=btn_info["command"],
-                font=("Segoe UI", 13, "bold"),
-                relief=tk.FLAT,
-                cursor="hand2",
-                padx=20,
-                pady=12
-            )
-            btn.pack(fill=tk.X, padx=24, pady=(24, 12))
-            
-            # Description
-            desc_label = tk.Label(
-                card,
-                text=btn_info["desc"],
-                font=("Segoe UI", 10),
-                bg=COLORS["bg_secondary"],
-                fg=COLORS["text_tertiary"]
-            )
-            desc_label.pack(pady=(0, 24))
+            card = f"{buttons_container}.card{i}"
+            command = self.root.register(btn_info["command"])
+            script += [
+                f"frame {card}",
+                f"grid {card} -row {row} -column {col} -padx 15 -pady 15 -sticky nsew",
+                f"grid columnconfigure {card} 0 -weight 1",
+                f"button {card}.button -text {{{btn_info['text']}}} -command {command}",
+                f"pack {card}.button -fill x -padx 24 -pady {{24 12}}",
+                f"label {card}.desc -text {{{btn_info['desc']}}}",
+                f"pack {card}.desc -pady {{0 24}}",
+            ]
+        self.root.tk.eval("\n".join(script))
         
         # Configure grid weights
         buttons_container.grid_columnconfigure(0, weight=1)
@@ -941,11 +1843,18 @@ class FaceRecognitionApp:
         buttons_container.grid_rowconfigure(3, weight=1)
     
     def show_training_page(self):
-        """Show the training page with modern dark theme."""
-        self.clear_frame()
-        
+        """Show the training page, building it on first use."""
+        self._show_page("training", self._build_training_page, on_show=self._refresh_training_page)
+    
+    def _refresh_training_page(self):
+        """Refresh training page content that may have changed while it was hidden."""
+        self.update_people_list()
+        self._update_model_status(self.detection_model.get())
+    
+    def _build_training_page(self, page):
+        """Create the training page with modern dark theme."""
         # Header
-        header_frame = tk.Frame(self.root, bg=COLORS["bg_secondary"], height=80)
+        header_frame = tk.Frame(page, bg=COLORS["bg_secondary"], height=80)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
         
@@ -955,7 +1864,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=self.create_homepage,
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=18,
@@ -966,14 +1875,14 @@ class FaceRecognitionApp:
         title_label = tk.Label(
             header_frame,
             text="Train Model",
-            font=("Segoe UI", 28, "bold"),
+            font=_tk_font(28, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         )
         title_label.pack(side=tk.LEFT, padx=24, pady=20)
         
         # Main content
-        content_frame = tk.Frame(self.root, bg=COLORS["bg_primary"])
+        content_frame = tk.Frame(page, bg=COLORS["bg_primary"])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
         
         # Left panel - Add Person
@@ -987,7 +1896,7 @@ class FaceRecognitionApp:
         tk.Label(
             left_card,
             text="Add New Person",
-            font=("Segoe UI", 18, "bold"),
+            font=_tk_font(18, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(pady=(28, 20))
@@ -995,7 +1904,7 @@ class FaceRecognitionApp:
         tk.Label(
             left_card,
             text="Person Name",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=24, pady=(14, 8))
@@ -1003,7 +1912,7 @@ class FaceRecognitionApp:
         name_entry = tk.Entry(
             left_card,
             textvariable=self.current_person_name,
-            font=("Segoe UI", 11),
+            font=_tk_font(11),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             insertbackground=COLORS["text_primary"],
@@ -1025,7 +1934,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=lambda: self.add_photos_for_person(self.current_person_name.get()),
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -1039,7 +1948,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=lambda: self.add_video_for_person(self.current_person_name.get()),
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -1053,7 +1962,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=self.import_from_folder,
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -1072,7 +1981,7 @@ class FaceRecognitionApp:
         tk.Label(
             right_card,
             text="Training Configuration",
-            font=("Segoe UI", 18, "bold"),
+            font=_tk_font(18, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(pady=(28, 20))
@@ -1081,7 +1990,7 @@ class FaceRecognitionApp:
         tk.Label(
             right_card,
             text="Face Detection Model",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=24, pady=(14, 6))
@@ -1089,7 +1998,7 @@ class FaceRecognitionApp:
         model_desc = tk.Label(
             right_card,
             text="Each model has separate training data",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_tertiary"]
         )
@@ -1098,51 +2007,20 @@ class FaceRecognitionApp:
         model_dropdown_frame = tk.Frame(right_card, bg=COLORS["bg_secondary"])
         model_dropdown_frame.pack(fill=tk.X, padx=20, pady=5)
         
-        # Check if RetinaFace is available (lazy check - don't load model)
-        retinaface_available = False
-        retinaface_error = None
-        try:
-            # Just check if module can be imported, don't create detector
-            import retinaface
-            retinaface_available = True
-        except ImportError as e:
-            retinaface_available = False
-            retinaface_error = str(e)
-        except Exception as e:
-            retinaface_available = False
-            retinaface_error = f"{type(e).__name__}: {str(e)}"
-        
-        # Check if DeepFace is available
-        deepface_available = False
-        deepface_error = None
-        try:
-            import deepface
-            deepface_available = True
-        except ImportError as e:
-            deepface_available = False
-            deepface_error = str(e)
-        except Exception as e:
-            deepface_available = False
-            deepface_error = f"{type(e).__name__}: {str(e)}"
-        
-        model_options = [
-            ("YOLOv11", "yolov11", "Latest YOLO, best accuracy"),
-            ("YOLOv8", "yolov8", "Stable YOLO version"),
-        ]
+        # Check if RetinaFace/DeepFace are installed (cached, doesn't import them)
+        retinaface_available, retinaface_error = _probe_module("retinaface")
+        deepface_available, deepface_error = _probe_module("deepface")
         
         if retinaface_available:
-            model_options.append(("RetinaFace", "retinaface", "Deep learning with landmarks"))
-        else:
+            retinaface_option = RETINAFACE_OPTION
+        elif retinaface_error and "tf-keras" in retinaface_error.lower():
             # Show specific error if available
-            if retinaface_error and "tf-keras" in retinaface_error.lower():
-                model_options.append(("RetinaFace (Needs tf-keras)", "retinaface", "Install: pip install tf-keras"))
-            else:
-                model_options.append(("RetinaFace (Not Available)", "retinaface", "Check dependencies"))
-        
-        if deepface_available:
-            model_options.append(("DeepFace", "deepface", "Face recognition + Emotion/Age/Race/Gender"))
+            retinaface_option = RETINAFACE_NEEDS_TF_KERAS_OPTION
         else:
-            model_options.append(("DeepFace (Not Installed)", "deepface", "Install: pip install deepface"))
+            retinaface_option = RETINAFACE_MISSING_OPTION
+        deepface_option = DEEPFACE_OPTION if deepface_available else DEEPFACE_MISSING_OPTION
+        model_options = (*MODEL_OPTIONS_BASE, retinaface_option, deepface_option)
+        model_info = {opt[1]: opt[2] for opt in model_options}
         
         # Model combo for training page
         model_combo = ttk.Combobox(
@@ -1172,21 +2050,16 @@ class FaceRecognitionApp:
                             "Please install dependencies or use YOLOv8/YOLOv11.\n\n"
                             "Switching to YOLOv11..."
                         )
-                    messagebox.showwarning("RetinaFace Not Available", msg)
+                    self._show_dialog("RetinaFace Not Available", msg, kind="warning")
                     self.detection_model.set("yolov11")
             
-            # Use trace_add for Python 3.8+ compatibility
-            try:
-                self.detection_model.trace_add('write', check_retinaface_selection)
-            except AttributeError:
-                # Fallback for older Python versions
-                self.detection_model.trace('w', check_retinaface_selection)
+            self._trace_detection_model("retinaface_guard", check_retinaface_selection)
         
         # Model info label
         self.model_info_label = tk.Label(
             model_dropdown_frame,
             text="",
-            font=("Segoe UI", 9),
+            font=_tk_font(9),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_secondary"]
         )
@@ -1194,28 +2067,23 @@ class FaceRecognitionApp:
         
         def update_model_info(*args):
             model_name = self.detection_model.get()
-            for opt in model_options:
-                if opt[1] == model_name:
-                    self.model_info_label.config(text=opt[2])
-                    break
+            if model_name in model_info:
+                self.model_info_label.config(text=model_info[model_name])
         
         def on_model_change(*args):
-            model_name = self.detection_model.get()
-            # Unload other models when switching (non-blocking)
-            self.root.after_idle(lambda: self._unload_other_models(model_name))
-            # Update status (non-blocking)
-            self.root.after(100, lambda: self._update_model_status(model_name))
+            # Unload other models and update status (coalesced across all model traces)
+            self._schedule_model_change()
             # Update model info
             update_model_info()
         
-        self.detection_model.trace('w', on_model_change)
+        self._trace_detection_model("training_model_info", on_model_change)
         update_model_info()  # Initial update
         
         # Encoding Model selection (for face_recognition library)
         tk.Label(
             right_card,
             text="Encoding Model",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=24, pady=(18, 8))
@@ -1228,7 +2096,7 @@ class FaceRecognitionApp:
             text="HOG (CPU - Faster)",
             variable=self.model_type,
             value="hog",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
             selectcolor=COLORS["bg_tertiary"],
@@ -1241,7 +2109,7 @@ class FaceRecognitionApp:
             text="CNN (GPU - More Accurate)",
             variable=self.model_type,
             value="cnn",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
             selectcolor=COLORS["bg_tertiary"],
@@ -1256,7 +2124,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=self.train_model,
-            font=("Segoe UI", 13, "bold"),
+            font=_tk_font(13, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=25,
@@ -1268,7 +2136,7 @@ class FaceRecognitionApp:
         self.training_status = tk.Label(
             right_card,
             text="",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["success"],
             wraplength=300
@@ -1286,7 +2154,7 @@ class FaceRecognitionApp:
         tk.Label(
             list_card,
             text="Registered People",
-            font=("Segoe UI", 18, "bold"),
+            font=_tk_font(18, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(pady=(24, 14))
@@ -1300,7 +2168,7 @@ class FaceRecognitionApp:
         
         self.people_listbox = tk.Listbox(
             list_container,
-            font=("Segoe UI", 11),
+            font=_tk_font(11),
             yscrollcommand=scrollbar.set,
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
@@ -1324,7 +2192,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=self.delete_person,
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -1334,7 +2202,7 @@ class FaceRecognitionApp:
     
     def show_deepface_calibration_page(self):
         """Show the DeepFace calibration page."""
-        if not self.deepface_calibrator:
+        if not self._get_calibrator():
             messagebox.showerror(
                 "DeepFace Not Available",
                 "DeepFace calibration requires DeepFace to be installed.\n\n"
@@ -1342,10 +2210,12 @@ class FaceRecognitionApp:
             )
             return
         
-        self.clear_frame()
-        
+        self._show_page("deepface_calibration", self._build_deepface_calibration_page)
+    
+    def _build_deepface_calibration_page(self, page):
+        """Create the DeepFace calibration page."""
         # Header
-        header_frame = tk.Frame(self.root, bg=COLORS["bg_secondary"], height=80)
+        header_frame = tk.Frame(page, bg=COLORS["bg_secondary"], height=80)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
         
@@ -1355,7 +2225,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=self.create_homepage,
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=18,
@@ -1366,14 +2236,14 @@ class FaceRecognitionApp:
         title_label = tk.Label(
             header_frame,
             text="DeepFace Calibration",
-            font=("Segoe UI", 28, "bold"),
+            font=_tk_font(28, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         )
         title_label.pack(side=tk.LEFT, padx=24, pady=20)
         
         # Main content
-        content_frame = tk.Frame(self.root, bg=COLORS["bg_primary"])
+        content_frame = tk.Frame(page, bg=COLORS["bg_primary"])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=40, pady=30)
         
         # Info card
@@ -1388,7 +2258,7 @@ class FaceRecognitionApp:
             info_card,
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             wrap=tk.WORD,
             height=6,
             relief=tk.FLAT,
@@ -1418,7 +2288,7 @@ class FaceRecognitionApp:
         tk.Label(
             folder_card,
             text="Person Training Folder",
-            font=("Segoe UI", 15, "bold"),
+            font=_tk_font(15, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=24, pady=(18, 6))
@@ -1426,7 +2296,7 @@ class FaceRecognitionApp:
         tk.Label(
             folder_card,
             text="Select folder containing emotion/, race/, and age/ subfolders (e.g., 'sreyas/')",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_tertiary"]
         ).pack(anchor=tk.W, padx=24, pady=(0, 12))
@@ -1438,7 +2308,7 @@ class FaceRecognitionApp:
         folder_entry = tk.Entry(
             folder_frame,
             textvariable=self.person_folder_path,
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             relief=tk.FLAT,
@@ -1452,7 +2322,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=lambda: self._browse_folder(self.person_folder_path),
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -1467,7 +2337,7 @@ class FaceRecognitionApp:
         self.deepface_status = tk.Label(
             action_frame,
             text="Ready to train",
-            font=("Segoe UI", 11),
+            font=_tk_font(11),
             bg=COLORS["bg_primary"],
             fg=COLORS["text_secondary"]
         )
@@ -1479,7 +2349,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=self.train_deepface_calibration,
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=25,
@@ -1495,43 +2365,52 @@ class FaceRecognitionApp:
     
     def train_deepface_calibration(self):
         """Train DeepFace calibration from selected person folder."""
-        if not self.deepface_calibrator:
-            messagebox.showerror("Error", "DeepFace calibrator not available")
+        if not self._get_calibrator():
+            self._show_dialog("Error", "DeepFace calibrator not available", kind="error")
+            return
+        
+        if self._calibration_running:
+            self._show_dialog("Training In Progress", "DeepFace calibration is already running.", kind="info")
             return
         
         person_folder_path = self.person_folder_path.get()
         if not person_folder_path:
-            messagebox.showwarning(
+            self._show_dialog(
                 "No Folder Selected",
-                "Please select a person training folder (e.g., 'sreyas/')."
+                "Please select a person training folder (e.g., 'sreyas/').",
+                kind="warning"
             )
             return
         
         person_folder = Path(person_folder_path)
         if not person_folder.exists():
-            messagebox.showerror(
+            self._show_dialog(
                 "Invalid Folder",
-                f"The selected folder does not exist:\n\n{person_folder}"
+                f"The selected folder does not exist:\n\n{person_folder}",
+                kind="error"
             )
             return
         
         # Disable train button and show progress
         self.deepface_status.config(text="Training in progress...", fg=COLORS["warning"])
-        self.root.update()
+        self.root.update_idletasks()
+        
+        last_reported = -1
+        
+        def show_progress(text):
+            self.deepface_status.config(text=text, fg=COLORS["warning"])
         
         def progress_callback(current, total, message):
-            self.deepface_status.config(
-                text=f"{message} ({current}/{total})",
-                fg=COLORS["warning"]
-            )
-            self.root.update()
+            nonlocal last_reported
+            # Throttle to roughly 100 updates per run
+            if current < total and current - last_reported < max(1, total // 100):
+                return
+            last_reported = current
+            # Called from calibration_thread - hand the update to the Tk thread
+            self.root.after(0, show_progress, f"{message} ({current}/{total})")
         
-        try:
-            stats = self.deepface_calibrator.train_from_person_folder(
-                person_folder=person_folder,
-                progress_callback=progress_callback
-            )
-            
+        def finish(stats):
+            self._calibration_running = False
             # Show results
             result_msg = (
                 f"Training completed for '{person_folder.name}'!\n\n"
@@ -1547,37 +2426,162 @@ class FaceRecognitionApp:
                 else:
                     result_msg += "\n".join(stats['errors'][:5]) + f"\n... and {len(stats['errors']) - 5} more"
             
-            messagebox.showinfo("Training Complete", result_msg)
+            self._show_dialog("Training Complete", result_msg, kind="info")
             self.deepface_status.config(
                 text=f"✓ Trained {person_folder.name}: {stats['emotion_samples']} emotion, {stats['race_samples']} race, {stats['age_samples']} age samples",
                 fg=COLORS["success"]
             )
-        except Exception as e:
-            messagebox.showerror("Training Error", f"Error during training:\n\n{str(e)}")
+        
+        def fail(error):
+            self._calibration_running = False
+            self._show_dialog("Training Error", f"Error during training:\n\n{error}", kind="error")
             self.deepface_status.config(text="Training failed", fg=COLORS["error"])
+        
+        def calibration_thread():
+            # Runs DeepFace on every image - keep it off the Tk thread so the window stays responsive
+            try:
+                stats = self.deepface_calibrator.train_from_person_folder(
+                    person_folder=person_folder,
+                    progress_callback=progress_callback
+                )
+            except Exception as e:
+                self.root.after(0, fail, str(e))
+                return
+            self.root.after(0, finish, stats)
+        
+        self._calibration_running = True
+        threading.Thread(target=calibration_thread, daemon=True).start()
+    
+    def _show_dialog(self, title, message, kind="info"):
+        """Show a modal message in a single reused dark-themed dialog (instead of building a messagebox each time)."""
+        if self._dialog is None:
+            dialog = tk.Toplevel(self.root)
+            dialog.withdraw()
+            dialog.transient(self.root)
+            dialog.resizable(False, False)
+            dialog.configure(bg=COLORS["bg_secondary"])
+            
+            self._dialog_label = tk.Label(
+                dialog,
+                font=_tk_font(11),
+                bg=COLORS["bg_secondary"],
+                justify=tk.LEFT,
+                wraplength=460
+            )
+            self._dialog_label.pack(padx=30, pady=(25, 15))
+            
+            self._dialog_closed = tk.BooleanVar(value=False)
+            
+            def close(*args):
+                dialog.grab_release()
+                dialog.withdraw()
+                self._dialog_closed.set(True)
+            
+            tk.Button(
+                dialog,
+                text="OK",
+                bg=COLORS["accent_blue"],
+                fg=COLORS["text_primary"],
+                activebackground=COLORS["bg_hover"],
+                command=close,
+                font=_tk_font(10, "bold"),
+                relief=tk.FLAT,
+                cursor="hand2",
+                padx=25,
+                pady=6
+            ).pack(pady=(0, 20))
+            dialog.protocol("WM_DELETE_WINDOW", close)
+            dialog.bind("<Return>", close)
+            dialog.bind("<Escape>", close)
+            self._dialog = dialog
+        
+        colors = {"info": COLORS["text_primary"], "warning": COLORS["warning"], "error": COLORS["error"]}
+        self._dialog.title(title)
+        self._dialog_label.config(text=message, fg=colors.get(kind, COLORS["text_primary"]))
+        self._dialog_closed.set(False)
+        self._dialog.deiconify()
+        self._dialog.lift()
+        self._dialog.focus_set()
+        self._dialog.grab_set()
+        self._dialog.wait_variable(self._dialog_closed)
+    
+    def _trace_detection_model(self, key, callback):
+        """Install a detection_model write trace under key, replacing any earlier one with the same key."""
+        old_id = self._traces.pop(key, None)
+        if old_id is not None:
+            self.detection_model.trace_remove('write', old_id)
+        self._traces[key] = self.detection_model.trace_add('write', callback)
+    
+    def _schedule_model_change(self):
+        """Debounce detection model changes so a burst of trace callbacks does the work once."""
+        if self._model_change_pending is not None:
+            self.root.after_cancel(self._model_change_pending)
+        self._model_change_pending = self.root.after(50, self._flush_model_change)
+    
+    def _flush_model_change(self):
+        """Unload unused detectors and refresh status labels for the selected model."""
+        self._model_change_pending = None
+        # Status labels are refreshed by the worker once unloading finishes
+        self._unload_other_models(self.detection_model.get())
+    
+    def _refresh_model_status(self, model_name):
+        """Refresh the homepage and training page status labels for a model."""
+        self._update_homepage_status()
+        if hasattr(self, 'training_status'):
+            self._update_model_status(model_name)
     
     def _unload_other_models(self, current_model):
-        """Unload models that are not currently selected."""
-        for other_model in list(self.detectors.keys()):
-            if other_model != current_model:
-                try:
-                    detector = self.detectors[other_model]
-                    if hasattr(detector, 'model'):
-                        del detector.model
-                    del self.detectors[other_model]
-                except:
-                    pass
-        # Keep only current model in cache
-        if current_model not in self.detectors:
-            self.detectors = {}
-        else:
-            self.detectors = {current_model: self.detectors[current_model]}
+        """Unload models that are not currently selected (runs on the model worker thread)."""
+        self._model_executor.submit(self._do_unload_other_models, current_model)
+    
+    def _do_unload_other_models(self, current_model):
+        """Drop every detector except current_model and free their memory."""
+        unloaded = []
+        with self._detectors_lock:
+            for other_model in list(self.detectors.keys()):
+                if other_model != current_model:
+                    detector = self.detectors.get(other_model)
+                    if detector is not None:
+                        unloaded.append(detector)
+                    self.detectors.pop(other_model, None)
+            # Only the current model stays referenced; the rest can now be freed
+            self._active_detector = self.detectors.get(current_model)
+        
+        # Releasing model weights (and GPU memory) can take a while - keep it off the Tk thread
+        for detector in unloaded:
+            try:
+                if hasattr(detector, 'model'):
+                    del detector.model
+            except:
+                pass
+        detector = None
+        unloaded = None
+        gc.collect()
+        # Release cached GPU memory if a torch-based backend was loaded
+        torch = sys.modules.get("torch")
+        if torch is not None:
+            try:
+                if torch.cuda.is_available():
+                    torch.cuda.empty_cache()
+            except:
+                pass
+        
+        self.root.after(0, self._refresh_model_status, current_model)
+    
+    def _count_people(self, model_name):
+        """Number of distinct people trained for a model, cached until its encodings change."""
+        num_people = self._people_counts.get(model_name)
+        if num_people is None:
+            name_encodings = self.loaded_encodings.get(model_name)
+            num_people = len(set(name_encodings.get("names", []))) if name_encodings else 0
+            self._people_counts[model_name] = num_people
+        return num_people
     
     def _update_model_status(self, model_name):
         """Update model status (called asynchronously to avoid lag)."""
         current_encodings = self.get_current_encodings()
         if current_encodings:
-            num_people = len(set(current_encodings.get("names", [])))
+            num_people = self._count_people(self.detection_model.get())
             self.training_status.config(
                 text=f"✓ {model_name.upper()} model selected - {num_people} person(s) trained",
                 fg=COLORS["success"]
@@ -1594,7 +2598,7 @@ class FaceRecognitionApp:
             try:
                 current_encodings = self.get_current_encodings()
                 if current_encodings:
-                    num_people = len(set(current_encodings.get("names", [])))
+                    num_people = self._count_people(self.detection_model.get())
                     model_name = self.detection_model.get().upper()
                     status_text = f"✓ {model_name} Active - {num_people} person(s) registered"
                     status_color = COLORS["success"]
@@ -1630,14 +2634,20 @@ class FaceRecognitionApp:
         
         if files:
             copied = 0
-            for file_path in files:
-                try:
-                    filename = os.path.basename(file_path)
-                    dest_path = person_dir / filename
-                    shutil.copy2(file_path, dest_path)
+            failed = []
+            pairs = [(file_path, person_dir / os.path.basename(file_path)) for file_path in files]
+            for (file_path, dest_path), error in zip(pairs, _copy_files(pairs)):
+                if error is None:
                     copied += 1
-                except Exception as e:
-                    messagebox.showerror("Error", f"Failed to copy {filename}: {str(e)}")
+                else:
+                    failed.append(f"{dest_path.name}: {str(error)}")
+            
+            # One summary dialog instead of one modal dialog per failed file
+            if failed:
+                error_msg = f"Failed to copy {len(failed)} file(s):\n\n" + "\n".join(failed[:20])
+                if len(failed) > 20:
+                    error_msg += f"\n... and {len(failed) - 20} more"
+                messagebox.showerror("Error", error_msg)
             
             messagebox.showinfo("Success", f"Added {copied} photo(s) for {person_name}")
             self.update_people_list()
@@ -1673,63 +2683,86 @@ class FaceRecognitionApp:
         progress_label = tk.Label(
             progress_window,
             text=f"Scanning {len(subfolders)} folder(s)...",
-            font=("Segoe UI", 11),
+            font=_tk_font(11),
             bg=COLORS["bg_primary"],
             fg=COLORS["text_primary"]
         )
         progress_label.pack(pady=30)
         
+        def finish(total_copied, people_imported):
+            progress_window.destroy()
+            if total_copied > 0:
+                msg = f"Successfully imported {total_copied} photo(s) from {len(people_imported)} person(s):\n\n"
+                msg += "\n".join(people_imported)
+                messagebox.showinfo("Import Complete", msg)
+                self.update_people_list()
+            else:
+                messagebox.showwarning("Warning", "No image files found in subfolders!")
+        
+        def fail(error):
+            progress_window.destroy()
+            messagebox.showerror("Error", f"Failed to import folder: {error}")
+        
         def import_thread():
             try:
-                image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.JPG', '.JPEG', '.PNG', '.BMP'}
-                total_copied = 0
-                people_imported = []
-                
+                # Plan every copy first, so the whole import goes through one pool of copy threads
+                pairs = []
+                pair_people = []
+                person_names = []
+                # Destinations already taken by this import (normcase so Windows compares case-insensitively)
+                planned = set()
                 for subfolder in subfolders:
                     person_name = subfolder.name.strip().replace(" ", "_")
                     person_dir = TRAINING_DIR / person_name
-                    person_dir.mkdir(exist_ok=True)
                     
                     # Find all image files in subfolder
-                    image_files = [f for f in subfolder.iterdir() 
-                                 if f.is_file() and f.suffix in image_extensions]
+                    with os.scandir(subfolder) as entries:
+                        image_files = [Path(entry.path) for entry in entries
+                                       if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTS]
                     
                     if not image_files:
                         continue
                     
-                    copied = 0
+                    person_dir.mkdir(exist_ok=True)
+                    if person_name not in person_names:
+                        person_names.append(person_name)
                     for image_file in image_files:
-                        try:
-                            # Copy to training directory
-                            dest_path = person_dir / image_file.name
-                            # If file exists, add timestamp to avoid overwrite
-                            if dest_path.exists():
-                                stem = dest_path.stem
-                                suffix = dest_path.suffix
-                                dest_path = person_dir / f"{stem}_imported{suffix}"
-                            
-                            shutil.copy2(image_file, dest_path)
-                            copied += 1
-                            total_copied += 1
-                        except Exception as e:
-                            print(f"Error copying {image_file}: {e}")
-                    
-                    if copied > 0:
-                        people_imported.append(f"{person_name} ({copied} photos)")
+                        # Copy to training directory
+                        dest_path = person_dir / image_file.name
+                        # Pick a name that neither exists on disk nor is planned by another folder mapping
+                        # to the same person (e.g. "John Doe" and "John_Doe"), as the copies run concurrently
+                        stem = dest_path.stem
+                        suffix = dest_path.suffix
+                        counter = 1
+                        while dest_path.exists() or os.path.normcase(str(dest_path)) in planned:
+                            tag = "_imported" if counter == 1 else f"_imported_{counter}"
+                            dest_path = person_dir / f"{stem}{tag}{suffix}"
+                            counter += 1
+                        planned.add(os.path.normcase(str(dest_path)))
+                        pairs.append((image_file, dest_path))
+                        pair_people.append(person_name)
                 
-                progress_window.destroy()
+                total = len(pairs)
+                step = max(1, total // 100)
                 
-                if total_copied > 0:
-                    msg = f"Successfully imported {total_copied} photo(s) from {len(people_imported)} person(s):\n\n"
-                    msg += "\n".join(people_imported)
-                    messagebox.showinfo("Import Complete", msg)
-                    self.update_people_list()
-                else:
-                    messagebox.showwarning("Warning", "No image files found in subfolders!")
-                    
+                def progress(done):
+                    if done % step == 0 or done == total:
+                        self.root.after(0, lambda: progress_label.config(text=f"Copying photos... ({done}/{total})"))
+                
+                copied_per_person = Counter()
+                for (image_file, _), person_name, error in zip(pairs, pair_people, _copy_files(pairs, progress)):
+                    if error is None:
+                        copied_per_person[person_name] += 1
+                    else:
+                        print(f"Error copying {image_file}: {error}")
+                
+                people_imported = [
+                    f"{person_name} ({copied_per_person[person_name]} photos)"
+                    for person_name in person_names if copied_per_person[person_name] > 0
+                ]
+                self.root.after(0, finish, sum(copied_per_person.values()), people_imported)
             except Exception as e:
-                progress_window.destroy()
-                messagebox.showerror("Error", f"Failed to import folder: {str(e)}")
+                self.root.after(0, fail, str(e))
         
         threading.Thread(target=import_thread, daemon=True).start()
     
@@ -1737,15 +2770,33 @@ class FaceRecognitionApp:
         """Update the list of registered people."""
         if not hasattr(self, 'people_listbox'):
             return  # People listbox not created yet
-        self.people_listbox.delete(0, tk.END)
+        entries = []
         if TRAINING_DIR.exists():
-            for person_dir in TRAINING_DIR.iterdir():
-                if person_dir.is_dir():
-                    num_photos = len(list(person_dir.glob("*")))
-                    self.people_listbox.insert(
-                        tk.END,
-                        f"{person_dir.name} ({num_photos} photos)"
-                    )
+            with os.scandir(TRAINING_DIR) as people:
+                for person_entry in people:
+                    if person_entry.is_dir():
+                        with os.scandir(person_entry.path) as files:
+                            num_photos = sum(1 for _ in files)
+                        entries.append(f"{person_entry.name} ({num_photos} photos)")
+        entries = tuple(sorted(entries))
+        
+        old_entries = self._people_entries
+        if entries == old_entries:
+            return  # Unchanged - keep the listbox (and its selection) as is
+        self._people_entries = entries
+        
+        # Only replace the rows between the unchanged head and tail, with one delete and one insert call
+        start = 0
+        end_limit = min(len(entries), len(old_entries))
+        while start < end_limit and entries[start] == old_entries[start]:
+            start += 1
+        tail = 0
+        while tail < end_limit - start and entries[-1 - tail] == old_entries[-1 - tail]:
+            tail += 1
+        if len(old_entries) - tail > start:
+            self.people_listbox.delete(start, len(old_entries) - tail - 1)
+        if len(entries) - tail > start:
+            self.people_listbox.insert(start, *entries[start:len(entries) - tail])
     
     def delete_person(self):
         """Delete selected person and their photos."""
@@ -1768,26 +2819,24 @@ class FaceRecognitionApp:
     
     def convert_image_to_rgb(self, image_path):
         """Convert image to RGB format."""
-        pil_image = Image.open(image_path)
-        if pil_image.mode != 'RGB':
-            pil_image = pil_image.convert('RGB')
-        return np.array(pil_image, dtype=np.uint8)
+        return _load_rgb(image_path)
     
     def train_model(self, incremental=True):
         """Train the face recognition model with incremental support."""
-        if not any(TRAINING_DIR.iterdir()):
+        with os.scandir(TRAINING_DIR) as entries:
+            training_dir_empty = next(entries, None) is None
+        if training_dir_empty:
             messagebox.showerror("Error", "No training data found! Please add people and photos first.")
             return
         
         # Check if selected model is available
         model_name = self.detection_model.get()
+        # Availability is checked without importing (TensorFlow would load on the Tk thread);
+        # the real import happens when the training thread creates the detector
         if model_name == "retinaface":
-            try:
-                # Just verify import, don't create detector yet
-                import retinaface
-            except ImportError as e:
-                error_msg = str(e)
-                if "tf-keras" in error_msg.lower():
+            retinaface_available, retinaface_error = _probe_module("retinaface")
+            if not retinaface_available:
+                if retinaface_error and "tf-keras" in retinaface_error.lower():
                     messagebox.showerror(
                         "RetinaFace Missing Dependency",
                         "RetinaFace requires tf-keras package.\n\n"
@@ -1804,18 +2853,9 @@ class FaceRecognitionApp:
                         "Or select a different model (YOLOv8 or YOLOv11)."
                     )
                 return
-            except Exception as e:
-                messagebox.showerror(
-                    "RetinaFace Error",
-                    f"RetinaFace cannot be used:\n\n{str(e)}\n\n"
-                    "Please use YOLOv8 or YOLOv11 instead."
-                )
-                return
         elif model_name == "deepface":
-            try:
-                # Just verify import, don't create detector yet
-                import deepface
-            except ImportError as e:
+            deepface_available, _ = _probe_module("deepface")
+            if not deepface_available:
                 messagebox.showerror(
                     "DeepFace Not Installed",
                     "DeepFace package is not installed.\n\n"
@@ -1824,13 +2864,6 @@ class FaceRecognitionApp:
                     "Or select a different model (YOLOv8, YOLOv11, or RetinaFace)."
                 )
                 return
-            except Exception as e:
-                messagebox.showerror(
-                    "DeepFace Error",
-                    f"DeepFace cannot be used:\n\n{str(e)}\n\n"
-                    "Please use YOLOv8, YOLOv11, or RetinaFace instead."
-                )
-                return
         
         # Get encoding model info for status
         encoding_model_type = self.model_type.get()
@@ -1863,50 +2896,44 @@ class FaceRecognitionApp:
                     ))
                     return
                 
-                current_encodings = self.get_current_encodings()
-                
-                # Load existing encodings for incremental training
+                # Load existing encodings for incremental training. These come from the float64 pickle,
+                # not the float16 sidecar in loaded_encodings, so retraining never rounds stored encodings
                 existing_names = []
                 existing_encodings = []
-                if incremental and current_encodings:
+                encodings_path = ENCODINGS_PATHS[model_name]
+                if incremental and self.loaded_encodings.get(model_name) and encodings_path.exists():
+                    current_encodings = _load_pickle(encodings_path)
                     existing_names = current_encodings.get("names", [])
                     existing_encodings = current_encodings.get("encodings", [])
                 
                 names = list(existing_names) if incremental else []
-                encodings = list(existing_encodings) if incremental else []
+                encodings = [np.array(e) for e in existing_encodings] if incremental else []
                 processed_count = 0
                 new_count = 0
                 skipped_count = 0
                 error_count = 0
                 error_files = []
                 
-                image_extensions = {'.jpg', '.jpeg', '.png', '.bmp', '.gif', '.JPG', '.JPEG', '.PNG', '.BMP'}
-                video_extensions = {'.mp4', '.avi', '.mov', '.mkv', '.MP4', '.AVI', '.MOV', '.MKV'}
-                all_files = list(TRAINING_DIR.glob("*/*"))
+                processed_mtimes = self.processed_files.get(model_name, {})
                 
-                # Filter files to process
+                # Filter files to process (DirEntry type checks come from the directory read, no extra stat)
                 files_to_process = []
-                for f in all_files:
-                    if f.is_file() and (f.suffix in image_extensions or f.suffix in video_extensions):
-                        # For incremental training, check if file is new or modified
-                        file_key = str(f.relative_to(TRAINING_DIR))
-                        processed_files_set = self.get_current_processed_files()
-                        if incremental and file_key in processed_files_set:
-                            # Check if file was modified
-                            try:
-                                if f.exists():
-                                    current_mtime = f.stat().st_mtime
-                                    # If file was modified, reprocess it
-                                    if file_key not in self.processed_files or True:  # Always check
-                                        files_to_process.append((f, file_key))
-                                    else:
-                                        skipped_count += 1
-                                else:
-                                    skipped_count += 1
-                            except:
-                                files_to_process.append((f, file_key))
-                        else:
-                            files_to_process.append((f, file_key))
+                file_mtimes = {}  # file_key -> mtime seen now, recorded once the file is trained
+                for person_entry, file_entry in _scandir_two_level(TRAINING_DIR):
+                    suffix = "." + file_entry.name.rpartition(".")[2].lower()
+                    if suffix in IMAGE_EXTS or suffix in VIDEO_EXTS:
+                        file_key = os.path.join(person_entry.name, file_entry.name)
+                        try:
+                            current_mtime = file_entry.stat().st_mtime
+                        except OSError:
+                            current_mtime = 0.0  # Let the loader report the problem
+                        # For incremental training, skip files unchanged since they were trained
+                        stored_mtime = processed_mtimes.get(file_key)
+                        if incremental and stored_mtime is not None and current_mtime <= stored_mtime:
+                            skipped_count += 1
+                            continue
+                        file_mtimes[file_key] = current_mtime
+                        files_to_process.append((Path(file_entry.path), file_key))
                 
                 total_files = len(files_to_process)
                 
@@ -1929,10 +2956,61 @@ class FaceRecognitionApp:
                         self.root.after(0, lambda: self.training_status.config(text="", fg=COLORS["success"]))
                     return
                 
+                # Files are marked as processed in this set as they succeed
+                model_processed_files = self.processed_files.setdefault(model_name, {})
+                
+                # Large image sets are encoded in worker processes (detection + encoding is
+                # CPU-bound and holds the GIL); videos and small sets stay on this thread
+                image_jobs = [job for job in files_to_process if job[0].suffix.lower() in IMAGE_EXTS]
+                pooled_results = {}
+                if len(image_jobs) >= PARALLEL_TRAINING_MIN_IMAGES and TRAINING_WORKERS > 1:
+                    try:
+                        # Spawn rather than fork: a fork of this process would inherit Tk, OpenMP/torch
+                        # threads and (with an NVIDIA detector loaded) a CUDA context it can't use
+                        with ProcessPoolExecutor(
+                            max_workers=TRAINING_WORKERS,
+                            mp_context=multiprocessing.get_context("spawn"),
+                            initializer=_init_encode_worker,
+                            initargs=(model_name,)
+                        ) as executor:
+                            results = executor.map(
+                                _encode_file,
+                                [str(filepath) for filepath, _ in image_jobs],
+                                repeat(encoding_model),
+                                chunksize=4
+                            )
+                            for (filepath, _), result in zip(image_jobs, results):
+                                # Only keep real outcomes; a file that failed for any other reason
+                                # (e.g. a worker-side detector error) is retried on this thread below
+                                if result[1] in (None, "no face detected", "encoding failed"):
+                                    pooled_results[filepath] = result
+                                else:
+                                    print(f"Worker could not process {filepath}, retrying serially: {result[1]}")
+                    except Exception as e:
+                        # Fall back to encoding the remaining images on this thread
+                        print(f"Parallel training unavailable, continuing serially: {e}")
+                
                 for filepath, file_key in files_to_process:
                     name = filepath.parent.name
+                    suffix = filepath.suffix.lower()
                     try:
-                        if filepath.suffix.lower() in [ext.lower() for ext in image_extensions]:
+                        if filepath in pooled_results:
+                            face_encodings, error = pooled_results.pop(filepath)
+                            if error:
+                                error_count += 1
+                                error_files.append(f"{filepath.name} ({error})")
+                                continue
+                            
+                            for encoding in face_encodings:
+                                names.append(name)
+                                encodings.append(encoding)
+                            
+                            processed_count += 1
+                            new_count += 1
+                            # Mark file as processed
+                            model_processed_files[file_key] = file_mtimes[file_key]
+                        
+                        elif suffix in IMAGE_EXTS:
                             # Process image
                             image = self.convert_image_to_rgb(filepath)
                             
@@ -1945,7 +3023,7 @@ class FaceRecognitionApp:
                                 continue
                             
                             # Use the encoding model selected by user (HOG -> small, CNN -> large)
-                            face_encodings = face_recognition.face_encodings(
+                            face_encodings = _face_encodings(
                                 image, face_locations, model=encoding_model
                             )
                             
@@ -1961,14 +3039,11 @@ class FaceRecognitionApp:
                             processed_count += 1
                             new_count += 1
                             # Mark file as processed
-                            if model_name not in self.processed_files:
-                                self.processed_files[model_name] = set()
-                            self.processed_files[model_name].add(file_key)
+                            model_processed_files[file_key] = file_mtimes[file_key]
                         
-                        elif filepath.suffix.lower() in [ext.lower() for ext in video_extensions]:
+                        elif suffix in VIDEO_EXTS:
                             # Process video - extract frames
                             # Detector already loaded at start of thread
-                            frame_count = 0
                             frames_processed = 0
                             
                             cap = cv2.VideoCapture(str(filepath))
@@ -1980,38 +3055,38 @@ class FaceRecognitionApp:
                             fps = cap.get(cv2.CAP_PROP_FPS)
                             frame_interval = max(1, int(fps / 2))  # Extract 2 frames per second
                             
-                            while True:
-                                ret, frame = cap.read()
-                                if not ret:
-                                    break
-                                
-                                if frame_count % frame_interval == 0:
-                                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                                    
-                                    face_locations = detector.detect_faces(rgb_frame)
-                                    
-                                    if face_locations:
-                                        # Use the encoding model selected by user (HOG -> small, CNN -> large)
-                                        face_encodings = face_recognition.face_encodings(
-                                            rgb_frame, face_locations, model=encoding_model
-                                        )
-                                        
-                                        for encoding in face_encodings:
-                                            names.append(name)
-                                            encodings.append(encoding)
-                                        frames_processed += 1
-                                
-                                frame_count += 1
+                            # Frames with faces are encoded in batches (all the same size) with one dlib call
+                            pending_frames = []
                             
-                            cap.release()
+                            def flush_frames():
+                                # Use the encoding model selected by user (HOG -> small, CNN -> large)
+                                for face_encodings in _face_encodings_batch(pending_frames, model=encoding_model):
+                                    for encoding in face_encodings:
+                                        names.append(name)
+                                        encodings.append(encoding)
+                                pending_frames.clear()
+                            
+                            # Frames are decoded on a background thread while this one runs detection.
+                            # Detection takes the decoded BGR frame; only frames with faces get an RGB copy
+                            try:
+                                with contextlib.closing(_iter_sampled_frames(cap, frame_interval, rgb=False)) as frames:
+                                    for frame in frames:
+                                        face_locations = detector.detect_faces_cv2(frame)
+                                        
+                                        if face_locations:
+                                            pending_frames.append((cv2.cvtColor(frame, cv2.COLOR_BGR2RGB), face_locations))
+                                            frames_processed += 1
+                                            if len(pending_frames) >= VIDEO_ENCODE_BATCH:
+                                                flush_frames()
+                                flush_frames()
+                            finally:
+                                cap.release()
                             
                             if frames_processed > 0:
                                 processed_count += 1
                                 new_count += 1
                                 # Mark file as processed
-                                if model_name not in self.processed_files:
-                                    self.processed_files[model_name] = set()
-                                self.processed_files[model_name].add(file_key)
+                                model_processed_files[file_key] = file_mtimes[file_key]
                             else:
                                 error_count += 1
                                 error_files.append(f"{filepath.name} (no faces in video)")
@@ -2037,14 +3112,23 @@ class FaceRecognitionApp:
                     ))
                     return
                 
-                name_encodings = {"names": names, "encodings": encodings}
+                # One (N, 128) matrix pickles as a single buffer instead of N array objects,
+                # and still loads anywhere a list of encodings is accepted
+                name_encodings = {"names": names, "encodings": np.asarray(encodings, dtype=np.float64).reshape(-1, 128)}
                 # Save to model-specific file
-                encodings_path = ENCODINGS_PATHS[model_name]
-                with encodings_path.open(mode="wb") as f:
-                    pickle.dump(name_encodings, f)
+                _dump_pickle(name_encodings, encodings_path)
                 
-                # Update loaded encodings
+                # Update loaded encodings. Replacing the entry drops the last reference to the old
+                # memory-mapped sidecar (the index holds its own copy), which unmaps it so the file
+                # can be replaced below
                 self.loaded_encodings[model_name] = name_encodings
+                self._index_encodings(model_name)
+                
+                # Refresh the memory-mappable copy (a stale one is ignored, so failure is not fatal)
+                try:
+                    _write_encodings_sidecar(name_encodings, encodings_path)
+                except Exception as e:
+                    print(f"Warning: Could not write encodings sidecar for {model_name}: {e}")
                 
                 # Save processed files list
                 self.save_processed_files(model_name)
@@ -2086,46 +3170,55 @@ class FaceRecognitionApp:
         
         threading.Thread(target=train_thread, daemon=True).start()
     
-    def recognize_face_in_frame(self, face_encoding):
+    def recognize_face_in_frame(self, face_encoding, model_name=None):
         """Compare face encoding with known encodings using improved distance-based matching."""
-        current_encodings = self.get_current_encodings()
-        if not current_encodings:
+        if model_name is None:
+            model_name = self.detection_model.get()
+        current_encodings = self.loaded_encodings.get(model_name)
+        index = self.encoding_index.get(model_name)
+        if not current_encodings or index is None:
             return None
         
-        # Use face_distance for more accurate matching
-        face_distances = face_recognition.face_distance(
-            current_encodings["encodings"], face_encoding
-        )
-        
-        # Find the best match (lowest distance)
-        best_match_index = np.argmin(face_distances)
-        best_distance = face_distances[best_match_index]
-        
         # Use a stricter threshold for better accuracy
         # Lower distance = better match (0.0 = identical, 1.0 = very different)
-        threshold = 0.40  # Balanced threshold (was 0.35 too strict, 0.45 too loose)
-        
-        if best_distance <= threshold:
-            # Get all matches within threshold and use weighted voting
-            matches = face_distances <= threshold
-            if matches.sum() > 0:
-                # Weight votes by inverse distance (closer = more weight)
-                weighted_votes = {}
-                for i in range(len(current_encodings["names"])):
-                    if matches[i]:
-                        name = current_encodings["names"][i]
-                        distance = face_distances[i]
-                        # Weight: closer faces get higher weight
-                        weight = 1.0 / (distance + 0.1)  # Add small value to avoid division by zero
-                        if name not in weighted_votes:
-                            weighted_votes[name] = 0
-                        weighted_votes[name] += weight
-                
-                if weighted_votes:
-                    # Return person with highest weighted vote
-                    return max(weighted_votes.items(), key=lambda x: x[1])[0]
-        
-        return None
+        # Weighted vote over all matches within threshold (closer = more weight)
+        return _best_match(index, face_encoding, MATCH_THRESHOLD)
+    
+    def recognize_faces_in_frame(self, face_encodings, model_name=None):
+        """recognize_face_in_frame for all of a frame's encodings at once (one matrix multiply for the distances)."""
+        if model_name is None:
+            model_name = self.detection_model.get()
+        index = self.encoding_index.get(model_name)
+        if not self.loaded_encodings.get(model_name) or index is None:
+            return [None] * len(face_encodings)
+        return _best_matches(index, face_encodings, MATCH_THRESHOLD)
+    
+    def _recognize_stream_faces(self, rgb_image, face_locations, model_name, encoding_model):
+        """
+        Names for faces in a camera frame, encoding with the fast 5-point landmark model where that's decisive.
+        
+        For a model trained with "large" encodings, faces whose nearest known encoding is ambiguous
+        (see STREAM_CONFIDENT_DISTANCE) are re-encoded with "large" before matching.
+        """
+        face_encodings = _face_encodings(rgb_image, face_locations, model="small")
+        index = self.encoding_index.get(model_name)
+        if not face_encodings or not self.loaded_encodings.get(model_name) or index is None:
+            return ["Unknown"] * len(face_encodings)
+        
+        # Every face against every known encoding in one matrix multiply
+        distances = _encoding_distance_matrix(index, face_encodings)
+        names = [_vote(index, row, MATCH_THRESHOLD) or "Unknown" for row in distances]
+        recheck = []
+        if encoding_model == "large":
+            nearest = distances.min(axis=1)
+            recheck = np.flatnonzero((nearest > STREAM_CONFIDENT_DISTANCE) & (nearest < STREAM_UNKNOWN_DISTANCE)).tolist()
+        
+        if recheck:
+            large_encodings = _face_encodings(rgb_image, [face_locations[i] for i in recheck], model="large")
+            large_names = self.recognize_faces_in_frame(large_encodings, model_name)
+            for i, name in zip(recheck, large_names):
+                names[i] = name or "Unknown"
+        return names
     
     def start_live_recognition(self):
         """Start live camera recognition."""
@@ -2170,7 +3263,7 @@ class FaceRecognitionApp:
         tk.Label(
             status_section,
             text="🎙️ Live Call Status",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=10, pady=(10, 5))
@@ -2179,7 +3272,7 @@ class FaceRecognitionApp:
         self.live_api_status_label = tk.Label(
             status_section,
             text="🔴 Disconnected",
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["error"],
             anchor=tk.W,
@@ -2194,7 +3287,7 @@ class FaceRecognitionApp:
         tk.Label(
             transcript_section,
             text="💬 Conversation",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=10, pady=(10, 5))
@@ -2209,7 +3302,7 @@ class FaceRecognitionApp:
         self.live_api_transcript_text = tk.Text(
             transcript_frame,
             wrap=tk.WORD,
-            font=("Segoe UI", 9),
+            font=_tk_font(9),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             relief=tk.FLAT,
@@ -2237,7 +3330,7 @@ class FaceRecognitionApp:
         status_label = tk.Label(
             top_controls,
             text="Camera Active - Press 'Stop' to close",
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         )
@@ -2255,7 +3348,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self.camera_flip_horizontal.set(not self.camera_flip_horizontal.get()),
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=12,
@@ -2271,7 +3364,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self.camera_flip_vertical.set(not self.camera_flip_vertical.get()),
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=12,
@@ -2287,7 +3380,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=self.rotate_camera,
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -2308,7 +3401,7 @@ class FaceRecognitionApp:
             activebackground=COLORS["bg_hover"],
             activeforeground=COLORS["text_primary"],
             command=self.toggle_live_api,
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -2325,7 +3418,7 @@ class FaceRecognitionApp:
             activebackground=COLORS["bg_hover"],
             activeforeground=COLORS["text_primary"],
             command=lambda: self.stop_camera(camera_window),
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -2334,187 +3427,270 @@ class FaceRecognitionApp:
         stop_btn.pack(side=tk.LEFT, padx=5)
         
         self.camera_running = True
-        self.video_capture = cv2.VideoCapture(self.camera_index.get())
+        self.video_capture = _open_camera(self.camera_index.get())
         
         if not self.video_capture.isOpened():
             messagebox.showerror("Error", f"Could not open camera {self.camera_index.get()}")
             camera_window.destroy()
             return
         
+        self._start_frame_reader()
+        camera_window.protocol("WM_DELETE_WINDOW", lambda: self.stop_camera(camera_window))
+        
         # Performance optimization variables
         process_frame_count = 0
         face_locations_cache = []
         face_names_cache = []
-        analysis_cache = {}  # Store analysis for each recognized face
+        analysis_cache = OrderedDict()  # AnalysisRow per recognized face, least recently updated first
+        analysis_seen = {}  # Frame count each analysis_cache key was last on screen
         
         # Audio recording variables
         audio_buffer = []
         last_audio_process_time = 0
         audio_process_interval = 3.0  # Process audio every 3 seconds
         
+        # One DeepFace analysis in flight per face; a face already being analysed is skipped, not queued
+        deepface_pool = self._deepface_pool = ThreadPoolExecutor(max_workers=1)
+        deepface_inflight = {}
+        analysis_latency = None  # Moving average of one analysis, seconds (set on the pool thread)
+        # When the last frame went to the worker, and the last one asked for DeepFace analysis
+        last_submit = 0.0
+        last_analyze = 0.0
+        # Thumbnail, time and settings of the last frame that actually ran detection
+        last_thumb = None
+        last_detect_time = 0.0
+        last_settings = None
+        last_result = None
+        # Detector handle for the model the worker last ran, looked up again only when the model changes
+        detector_model = None
+        detector = None
+        # [name, passes left] for recently recognized faces by box-centre bucket, see FACE_TRACK_TTL
+        face_track = {}
+        # Detection-size frame buffers reused by every pass, see _downscale_to_rgb
+        small_buffers = {}
+        
+        def analyze_face(deepface_analyzer, face_roi, name):
+            """Run DeepFace on one BGR face crop and return its overlay entry (runs on the DeepFace pool)."""
+            nonlocal analysis_latency
+            start = time.perf_counter()
+            try:
+                # DeepFace takes the BGR crop directly - no temp JPEG round-trip
+                analysis = deepface_analyzer.analyze_face(
+                    face_roi,
+                    actions=['emotion', 'age', 'gender', 'race']
+                )
+                
+                # Store analysis even if partial (some actions may have failed)
+                # Apply calibration if available
+                # This combines: 1) DeepFace pre-trained model predictions + 2) Your personal training data
+                if self._get_calibrator() and name != "Unknown" and analysis:
+                    try:
+                        # Apply personal calibration on top of DeepFace model predictions
+                        analysis = self.deepface_calibrator.calibrate_result(name, analysis)
+                    except Exception as e:
+                        _print_throttled("Calibration error", e)
+                elif analysis:
+                    # Even without calibration, we still use DeepFace pre-trained model predictions
+                    pass
+                
+                return AnalysisRow(
+                    emotion=analysis.get('dominant_emotion', 'N/A') if analysis else 'N/A',
+                    age=int(analysis.get('age', 0)) if analysis and analysis.get('age') else 0,
+                    gender=analysis.get('dominant_gender', 'N/A') if analysis else 'N/A',
+                    race=analysis.get('dominant_race', 'N/A') if analysis else 'N/A'
+                )
+            except Exception as e:
+                # Print error for debugging
+                _print_throttled("DeepFace analysis error", e)
+                return None
+            finally:
+                analysis_latency = _ewma(analysis_latency, time.perf_counter() - start)
+        
+        def process_frame(job):
+            """Detect, recognize and analyse one frame (runs on the inference worker thread)."""
+            nonlocal last_thumb, last_detect_time, last_settings, last_result, detector_model, detector
+            frame, detect_scale, model_name, encoding_model, analyze = job
+            
+            # Skip detection on a near-identical frame - a still scene gives the same faces
+            thumb = cv2.resize(frame, (32, 24), interpolation=cv2.INTER_AREA)
+            now = time.time()
+            settings = (detect_scale, model_name, encoding_model)
+            if (
+                last_result is not None
+                and settings == last_settings
+                and now - last_detect_time < STATIC_FRAME_MAX_AGE
+                and thumb.shape == last_thumb.shape
+                and cv2.absdiff(thumb, last_thumb).mean() < STATIC_FRAME_DIFF
+            ):
+                return last_result
+            last_thumb = thumb
+            last_detect_time = now
+            if settings != last_settings:
+                # Buckets and names found under other settings don't carry over
+                face_track.clear()
+            last_settings = settings
+            
+            # Detect faces
+            if model_name != detector_model:
+                detector = self.get_detector(model_name)
+                detector_model = model_name
+            
+            # Resize for faster processing (boxes are scaled back up when drawing). YOLO detects on the
+            # BGR frame directly; the RGB copy is then only made if some face needs encoding
+            if model_name in BGR_NATIVE_MODELS:
+                small_frame = _downscale(frame, detect_scale, buffers=small_buffers)
+                rgb_small_frame = None
+                face_locations = detector.detect_faces_cv2(small_frame)
+            else:
+                rgb_small_frame = _downscale_to_rgb(frame, detect_scale, buffers=small_buffers)
+                face_locations = detector.detect_faces(rgb_small_frame)
+            
+            # Faces still in the bucket of one recognized in a recent pass keep that name,
+            # so only new or moved faces go through the encoder
+            for entry in face_track.values():
+                entry[1] -= 1
+            buckets = [
+                (int(left + right) // (2 * FACE_TRACK_BUCKET), int(top + bottom) // (2 * FACE_TRACK_BUCKET))
+                for top, right, bottom, left in face_locations
+            ]
+            face_names = ["Unknown"] * len(face_locations)
+            to_encode = []
+            for i, bucket in enumerate(buckets):
+                entry = face_track.get(bucket)
+                if entry is not None and entry[1] > 0:
+                    face_names[i] = entry[0]
+                else:
+                    to_encode.append(i)
+            
+            if to_encode:
+                if rgb_small_frame is None:
+                    rgb_small_frame = _bgr_to_rgb(small_frame, small_buffers)
+                # Recognize faces (5-point encodings, with the selected model only for unclear matches)
+                new_names = self._recognize_stream_faces(
+                    rgb_small_frame, [face_locations[i] for i in to_encode], model_name, encoding_model
+                )
+                for i, name in zip(to_encode, new_names):
+                    face_names[i] = name
+                    face_track[buckets[i]] = [name, FACE_TRACK_TTL]
+            
+            for bucket in [bucket for bucket, entry in face_track.items() if entry[1] <= 0]:
+                del face_track[bucket]
+            
+            # The detector doubles as the analyzer when using the DeepFace model
+            deepface_analyzer = detector if model_name == "deepface" else None
+            
+            # Boxes at full frame size, scaled once for both the DeepFace crops and drawing
+            face_boxes = _scale_boxes(face_locations, detect_scale)
+            if deepface_analyzer and analyze:
+                # Clamped copies for cropping (ensure valid bounds)
+                crop_boxes = np.clip(face_boxes, 0, np.array(frame.shape[:2] * 2, dtype=np.int32))
+            
+            for i, name in enumerate(face_names):
+                # Get DeepFace analysis for all faces (less frequently for performance)
+                if deepface_analyzer and analyze:
+                    try:
+                        if i < len(crop_boxes):
+                            # Extract face region
+                            top, right, bottom, left = crop_boxes[i].tolist()
+                            
+                            if bottom > top and right > left:
+                                face_roi = frame[top:bottom, left:right]
+                                if face_roi.size > 0 and face_roi.shape[0] > 20 and face_roi.shape[1] > 20:
+                                    # Use face index as key if name is Unknown, otherwise use name
+                                    cache_key = name if name != "Unknown" else f"Face_{i}"
+                                    if cache_key not in deepface_inflight:
+                                        # Copy just the crop so the queued job doesn't keep the whole frame alive
+                                        deepface_inflight[cache_key] = deepface_pool.submit(
+                                            analyze_face, deepface_analyzer, face_roi.copy(), name
+                                        )
+                    except Exception as e:
+                        # Print error for debugging
+                        _print_throttled("DeepFace analysis error", e)
+                        pass
+            
+            last_result = (face_boxes.tolist(), face_names)
+            return last_result
+        
+        self._inference_worker = _LatestJobWorker(process_frame)
+        
         def update_frame():
-            nonlocal process_frame_count, face_locations_cache, face_names_cache, analysis_cache
+            nonlocal process_frame_count, face_locations_cache, face_names_cache, last_submit, last_analyze
             
             if not self.camera_running:
                 return
             
-            ret, frame = self.video_capture.read()
-            if ret:
-                # Apply camera transformations (flip/rotate)
-                if self.camera_flip_horizontal.get():
-                    frame = cv2.flip(frame, 1)  # Horizontal flip
-                if self.camera_flip_vertical.get():
-                    frame = cv2.flip(frame, 0)  # Vertical flip
-                
-                # Apply rotation
-                rotation = self.camera_rotate.get()
-                if rotation == 90:
-                    frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-                elif rotation == 180:
-                    frame = cv2.rotate(frame, cv2.ROTATE_180)
-                elif rotation == 270:
-                    frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-                
-                # Only process every 3rd frame for better performance
-                process_frame_count += 1
-                should_process = (process_frame_count % 3 == 0)
-                
-                if should_process:
-                    # Resize for faster processing
-                    small_frame = cv2.resize(frame, (0, 0), fx=0.4, fy=0.4)
-                    rgb_small_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
-                    
-                    # Detect faces
-                    detector = self.get_detector()
-                    face_locations_cache = detector.detect_faces(rgb_small_frame)
-                    
-                    # Get encodings with selected model (HOG -> small, CNN -> large)
-                    encoding_model = "small" if self.model_type.get() == "hog" else "large"
-                    face_encodings = face_recognition.face_encodings(
-                        rgb_small_frame, face_locations_cache, model=encoding_model
-                    )
-                    
-                    # Recognize faces and get analysis
-                    face_names_cache = []
-                    # Don't reset analysis_cache - keep previous analysis until updated
-                    
-                    # Get DeepFace analyzer if using DeepFace model
-                    deepface_analyzer = None
-                    if self.detection_model.get() == "deepface":
-                        try:
-                            deepface_analyzer = self.get_detector()
-                        except:
-                            pass
-                    
-                    for i, face_encoding in enumerate(face_encodings):
-                        name = self.recognize_face_in_frame(face_encoding)
-                        name = name if name else "Unknown"
-                        face_names_cache.append(name)
-                        
-                        # Get DeepFace analysis for all faces (less frequently for performance)
-                        if deepface_analyzer and (process_frame_count % 9 == 0):
-                            try:
-                                # Scale back to full frame size for analysis
-                                scale_factor = 1 / 0.4
-                                if i < len(face_locations_cache):
-                                    top, right, bottom, left = face_locations_cache[i]
-                                    top = int(top * scale_factor)
-                                    right = int(right * scale_factor)
-                                    bottom = int(bottom * scale_factor)
-                                    left = int(left * scale_factor)
-                                    
-                                    # Extract face region (ensure valid bounds)
-                                    top = max(0, top)
-                                    left = max(0, left)
-                                    bottom = min(frame.shape[0], bottom)
-                                    right = min(frame.shape[1], right)
-                                    
-                                    if bottom > top and right > left:
-                                        face_roi = frame[top:bottom, left:right]
-                                        if face_roi.size > 0 and face_roi.shape[0] > 20 and face_roi.shape[1] > 20:
-                                            import tempfile
-                                            import os
-                                            temp_fd, temp_path = tempfile.mkstemp(suffix='.jpg')
-                                            os.close(temp_fd)
-                                            cv2.imwrite(temp_path, face_roi)
-                                            
-                                            analysis = deepface_analyzer.analyze_face(
-                                                temp_path,
-                                                actions=['emotion', 'age', 'gender', 'race']
-                                            )
-                                            
-                                            # Store analysis even if partial (some actions may have failed)
-                                            # Apply calibration if available
-                                            # This combines: 1) DeepFace pre-trained model predictions + 2) Your personal training data
-                                            if self.deepface_calibrator and name != "Unknown" and analysis:
-                                                try:
-                                                    # Apply personal calibration on top of DeepFace model predictions
-                                                    analysis = self.deepface_calibrator.calibrate_result(name, analysis)
-                                                except Exception as e:
-                                                    print(f"Calibration error: {e}")
-                                            elif analysis:
-                                                # Even without calibration, we still use DeepFace pre-trained model predictions
-                                                pass
-                                            
-                                            # Use face index as key if name is Unknown, otherwise use name
-                                            cache_key = name if name != "Unknown" else f"Face_{i}"
-                                            analysis_cache[cache_key] = {
-                                                'emotion': analysis.get('dominant_emotion', 'N/A') if analysis else 'N/A',
-                                                'age': int(analysis.get('age', 0)) if analysis and analysis.get('age') else 0,
-                                                'gender': analysis.get('dominant_gender', 'N/A') if analysis else 'N/A',
-                                                'race': analysis.get('dominant_race', 'N/A') if analysis else 'N/A'
-                                            }
-                                            
-                                            os.remove(temp_path)
-                            except Exception as e:
-                                # Print error for debugging
-                                print(f"DeepFace analysis error: {e}")
-                                pass
+            ret, frame = self._read_latest_frame()
+            if ret:
+                # Apply camera transformations (flip/rotate, combined into at most two passes)
+                frame = _apply_steps(frame, self._orientation)
                 
-                # Draw on full-size frame using cached results
-                scale_factor = 1 / 0.4  # Inverse of resize factor
+                # Only send every Nth frame to the worker, and no faster than it has been getting through
+                # them - boxes from the last pass are reused in between
+                process_frame_count += 1
+                now = time.perf_counter()
+                if (
+                    process_frame_count % self._get_detect_every() == 0
+                    and now - last_submit >= (self._inference_worker.latency or 0.0)
+                ):
+                    last_submit = now
+                    # DeepFace analysis rounds are paced by how long an analysis takes, too
+                    analyze = now - last_analyze >= max(ANALYSIS_MIN_INTERVAL, analysis_latency or 0.0)
+                    if analyze:
+                        last_analyze = now
+                    # The worker gets its own copy - this frame is drawn on below
+                    self._inference_worker.submit((
+                        frame.copy(),
+                        self._get_detect_scale(),
+                        self._model_name,
+                        self._encoding_model,
+                        analyze,
+                    ))
                 
-                # Draw face bounding boxes and names
-                for (top, right, bottom, left), name in zip(face_locations_cache, face_names_cache):
-                    # Scale back to full frame size
-                    top = int(top * scale_factor)
-                    right = int(right * scale_factor)
-                    bottom = int(bottom * scale_factor)
-                    left = int(left * scale_factor)
-                    
-                    color = (0, 255, 0) if name != "Unknown" else (0, 0, 255)
-                    cv2.rectangle(frame, (left, top), (right, bottom), color, 3)
-                    
-                    # Draw name label (simpler, analysis shown in overlay)
-                    display_text = name
-                    text_size = cv2.getTextSize(display_text, cv2.FONT_HERSHEY_DUPLEX, 0.7, 2)[0]
-                    text_height = text_size[1] + 10
-                    
-                    # Draw background for name
-                    cv2.rectangle(
-                        frame, (left, bottom - text_height), (right, bottom), color, cv2.FILLED
-                    )
-                    
-                    # Draw name
-                    font = cv2.FONT_HERSHEY_DUPLEX
-                    cv2.putText(
-                        frame, display_text, (left + 6, bottom - 10),
-                        font, 0.7, (255, 255, 255), 2
-                    )
+                # Pick up the newest finished detection
+                result = self._inference_worker.result
+                if result is not None:
+                    face_locations_cache, face_names_cache = result
+                
+                # Merge any DeepFace analyses that finished since the last frame
+                for cache_key, future in list(deepface_inflight.items()):
+                    if future.done():
+                        del deepface_inflight[cache_key]
+                        analysis = future.result()
+                        if analysis is not None:
+                            analysis_cache[cache_key] = analysis
+                            analysis_cache.move_to_end(cache_key)
+                            analysis_seen[cache_key] = process_frame_count
+                
+                # Keep the overlay to people seen recently: refresh the faces on screen, then drop
+                # entries gone for ANALYSIS_MAX_AGE frames and the oldest beyond ANALYSIS_CACHE_SIZE
+                for idx, name in enumerate(face_names_cache):
+                    cache_key = name if name != "Unknown" else f"Face_{idx}"
+                    if cache_key in analysis_cache:
+                        analysis_seen[cache_key] = process_frame_count
+                stale = [
+                    cache_key for cache_key in analysis_cache
+                    if process_frame_count - analysis_seen.get(cache_key, process_frame_count) > ANALYSIS_MAX_AGE
+                ]
+                for cache_key in stale:
+                    del analysis_cache[cache_key]
+                while len(analysis_cache) > ANALYSIS_CACHE_SIZE:
+                    stale.append(analysis_cache.popitem(last=False)[0])
+                for cache_key in stale:
+                    analysis_seen.pop(cache_key, None)
+                
+                # Draw face bounding boxes and names (the worker already scaled them to full frame size)
+                # Name labels stay simple, analysis is shown in the overlay
+                _draw_face_boxes(frame, face_locations_cache, face_names_cache)
                 
                 # Draw analysis overlay in top-left corner (if using DeepFace)
                 # Show overlay even if analysis_cache is empty (will show "N/A" for missing data)
-                if self.detection_model.get() == "deepface":
+                if self._model_name == "deepface":
                     # If we have faces but no analysis yet, create placeholder entries
                     if not analysis_cache and face_names_cache:
                         for idx, name in enumerate(face_names_cache):
                             cache_key = name if name != "Unknown" else f"Face_{idx}"
-                            analysis_cache[cache_key] = {
-                                'emotion': 'Processing...',
-                                'age': 0,
-                                'gender': 'Processing...',
-                                'race': 'Processing...'
-                            }
+                            analysis_cache[cache_key] = AnalysisRow('Processing...', 0, 'Processing...', 'Processing...')
+                            analysis_seen[cache_key] = process_frame_count
                     
                     # Calculate overlay size based on number of people
                     num_people = len(analysis_cache) if analysis_cache else (len(face_names_cache) if face_names_cache else 1)
@@ -2523,12 +3699,10 @@ class FaceRecognitionApp:
                     overlay_width = 320
                     overlay_height = min(300, 50 + num_people * 90)  # Dynamic height, increased for more info
                     
-                    # Semi-transparent background
-                    overlay = frame.copy()
-                    cv2.rectangle(overlay, (overlay_x, overlay_y), 
-                                 (overlay_x + overlay_width, overlay_y + overlay_height), 
-                                 (0, 0, 0), -1)
-                    cv2.addWeighted(overlay, 0.75, frame, 0.25, 0, frame)
+                    # Semi-transparent background: blending 75% black over the panel is the same as
+                    # scaling its pixels by 0.25, done in place on just that region (no frame copy)
+                    panel = frame[overlay_y:overlay_y + overlay_height + 1, overlay_x:overlay_x + overlay_width + 1]
+                    cv2.convertScaleAbs(panel, dst=panel, alpha=0.25)
                     
                     # Draw title with border
                     title = "DeepFace Analysis"
@@ -2540,56 +3714,29 @@ class FaceRecognitionApp:
                     # Draw analysis for each person (both recognized and unknown)
                     y_offset = overlay_y + 55
                     line_height = 22
-                    for person_key, analysis_data in analysis_cache.items():
+                    for person_key, row in analysis_cache.items():
                         if y_offset + line_height * 5 > overlay_y + overlay_height - 10:
                             break  # Don't overflow overlay
                         
+                        # Lines are formatted once per distinct (person, analysis), not every frame
+                        person_line, detail_lines = _analysis_lines(person_key, row)
+                        
                         # Person name (highlighted)
-                        display_name = person_key if person_key.startswith("Face_") else person_key
-                        cv2.putText(frame, f"Person: {display_name}", 
+                        cv2.putText(frame, person_line, 
                                   (overlay_x + 10, y_offset),
                                   cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
                         y_offset += line_height
                         
-                        # Emotion
-                        emotion = analysis_data.get('emotion', 'N/A')
-                        cv2.putText(frame, f"  Emotion: {emotion}", 
-                                  (overlay_x + 10, y_offset),
-                                  cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                        y_offset += line_height
-                        
-                        # Age and Gender
-                        age = analysis_data.get('age', 0)
-                        gender = analysis_data.get('gender', 'N/A')
-                        cv2.putText(frame, f"  Age: {age}y | Gender: {gender}", 
-                                  (overlay_x + 10, y_offset),
-                                  cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                        y_offset += line_height
-                        
-                        # Race (if available)
-                        race = analysis_data.get('race', 'N/A')
-                        if race != 'N/A':
-                            cv2.putText(frame, f"  Race: {race}", 
+                        # Emotion, age and gender, race
+                        for line in detail_lines:
+                            cv2.putText(frame, line, 
                                       (overlay_x + 10, y_offset),
                                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
                             y_offset += line_height
                         
-                        y_offset += 5  # Spacing between people
-                        
-                        # Race
-                        race = analysis_data.get('race', 'N/A')
-                        cv2.putText(frame, f"  Race: {race}", 
-                                  (overlay_x + 10, y_offset),
-                                  cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
-                        y_offset += line_height + 8  # Extra space between people
+                        y_offset += 8  # Extra space between people
                 
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame_rgb)
-                img = img.resize((880, 660), Image.Resampling.LANCZOS)
-                imgtk = ImageTk.PhotoImage(image=img)
-                
-                video_label.imgtk = imgtk
-                video_label.config(image=imgtk)
+                self._show_frame(video_label, frame, (880, 660))
             
             if self.camera_running:
                 camera_window.after(33, update_frame)  # ~30 FPS for better performance
@@ -2603,9 +3750,126 @@ class FaceRecognitionApp:
         self.camera_rotate.set(next_rotation)
         print(f"Camera rotated to {next_rotation} degrees")
     
+    def _update_orientation(self, *args):
+        """Recompute the camera flip/rotate steps after one of the toggles changes."""
+        self._orientation = _orientation_steps(
+            self.camera_flip_horizontal.get(), self.camera_flip_vertical.get(), self.camera_rotate.get()
+        )
+    
+    def _mirror_var(self, var, attr, read=None):
+        """Keep self.<attr> in sync with a Tk variable (through read, if given) via a write trace."""
+        read = read or var.get
+        
+        def sync(*args):
+            setattr(self, attr, read())
+        
+        sync()
+        var.trace_add('write', sync)
+    
+    def _read_detect_scale(self):
+        """Read the detection downscale factor, clamped to a sane range."""
+        try:
+            scale = float(self.detect_scale.get())
+        except (tk.TclError, ValueError):
+            scale = 0.4
+        return min(max(scale, 0.2), 1.0)
+    
+    def _read_detect_every(self):
+        """Read how often (in frames) detection runs on the camera feed."""
+        try:
+            every = int(self.detect_every.get())
+        except (tk.TclError, ValueError):
+            every = 3
+        return min(max(every, 1), 10)
+    
+    def _get_detect_scale(self):
+        """Get the detection downscale factor (kept current by a trace on detect_scale)."""
+        return self._detect_scale
+    
+    def _get_detect_every(self):
+        """Get how often (in frames) detection runs on the camera feed (kept current by a trace on detect_every)."""
+        return self._detect_every
+    
+    def _show_frame(self, label, frame, size):
+        """Display a BGR frame in a label at size, reusing its resize/colour buffers and PhotoImage."""
+        width, height = size
+        buffers = getattr(label, "display_buffers", None)
+        if buffers is None or buffers[0].shape[:2] != (height, width):
+            buffers = (np.empty((height, width, 3), dtype=np.uint8), np.empty((height, width, 3), dtype=np.uint8))
+            label.display_buffers = buffers
+        resized, rgb_buf = buffers
+        
+        # Resize first so the colour swap only touches display-sized pixels.
+        # INTER_AREA is best for shrinking but turns into nearest-neighbour when enlarging
+        frame_height, frame_width = frame.shape[:2]
+        shrinking = frame_width >= width and frame_height >= height
+        cv2.resize(frame, size, dst=resized, interpolation=cv2.INTER_AREA if shrinking else cv2.INTER_LINEAR)
+        cv2.cvtColor(resized, cv2.COLOR_BGR2RGB, dst=rgb_buf)
+        
+        # Wrap the buffer without copying; PhotoImage copies the pixels into Tk
+        img = Image.frombuffer('RGB', size, rgb_buf, 'raw', 'RGB', 0, 1)
+        
+        # Paste into the label's existing PhotoImage; only allocate a new one when the size changes
+        imgtk = getattr(label, "imgtk", None)
+        if imgtk is not None and (imgtk.width(), imgtk.height()) == img.size:
+            imgtk.paste(img)
+            return
+        imgtk = ImageTk.PhotoImage(image=img)
+        label.imgtk = imgtk
+        label.config(image=imgtk)
+    
+    def _start_frame_reader(self):
+        """Read camera frames on a background thread so decode stalls don't block detection or the UI."""
+        self._frame_q = queue.Queue(maxsize=2)
+        
+        def reader():
+            capture = self.video_capture
+            frame_q = self._frame_q
+            while self.camera_running:
+                ok, frame = capture.read()
+                if not ok:
+                    time.sleep(0.01)
+                    continue
+                # Keep only the newest frames - drop the oldest when the consumer falls behind
+                try:
+                    frame_q.put_nowait(frame)
+                except queue.Full:
+                    try:
+                        frame_q.get_nowait()
+                    except queue.Empty:
+                        pass
+                    frame_q.put_nowait(frame)
+        
+        self._frame_reader = threading.Thread(target=reader, daemon=True)
+        self._frame_reader.start()
+    
+    def _read_latest_frame(self):
+        """Return (ret, frame) for the newest frame from the reader thread, like VideoCapture.read()."""
+        if self._frame_q is None:
+            return False, None
+        frame = None
+        try:
+            while True:
+                frame = self._frame_q.get_nowait()
+        except queue.Empty:
+            pass
+        return frame is not None, frame
+    
     def stop_camera(self, window):
         """Stop the camera and close the window."""
         self.camera_running = False
+        if self._inference_worker is not None:
+            self._inference_worker.stop()
+            self._inference_worker = None
+        if self._deepface_pool is not None:
+            # Drop queued analyses; one already running finishes in the background
+            self._deepface_pool.shutdown(wait=False, cancel_futures=True)
+            self._deepface_pool = None
+        # Let the reader thread finish its current read before releasing the capture
+        if self._frame_reader is not None:
+            self._frame_reader.join(timeout=1.0)
+            self._frame_reader = None
+        self._frame_q = None
         if self.video_capture:
             self.video_capture.release()
         
@@ -2703,7 +3967,7 @@ class FaceRecognitionApp:
         tk.Label(
             status_section,
             text="📋 Attendance Status",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=10, pady=(10, 5))
@@ -2712,7 +3976,7 @@ class FaceRecognitionApp:
         status_info = tk.Label(
             status_section,
             text="Students will be marked as 'Present'\nin Google Sheet when recognized.",
-            font=("Segoe UI", 9),
+            font=_tk_font(9),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_secondary"],
             justify=tk.LEFT,
@@ -2729,7 +3993,7 @@ class FaceRecognitionApp:
         
         attendance_listbox = tk.Listbox(
             list_frame,
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             relief=tk.FLAT,
@@ -2751,7 +4015,7 @@ class FaceRecognitionApp:
         status_label = tk.Label(
             top_controls,
             text=f"Smart Attendance Active (YOLOv11) - {len(self.seen_today)} student(s) marked",
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         )
@@ -2769,7 +4033,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self.camera_flip_horizontal.set(not self.camera_flip_horizontal.get()),
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=12,
@@ -2785,7 +4049,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self.camera_flip_vertical.set(not self.camera_flip_vertical.get()),
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=12,
@@ -2801,7 +4065,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=self.rotate_camera,
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -2821,7 +4085,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self._check_spreadsheet(attendance_listbox, status_label),
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -2837,7 +4101,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self._reset_attendance(attendance_listbox, status_label),
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -2853,7 +4117,7 @@ class FaceRecognitionApp:
             fg=COLORS["text_primary"],
             activebackground=COLORS["bg_hover"],
             command=lambda: self.stop_camera(camera_window),
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -2862,13 +4126,15 @@ class FaceRecognitionApp:
         stop_btn.pack(side=tk.LEFT, padx=5)
         
         self.camera_running = True
-        self.video_capture = cv2.VideoCapture(self.camera_index.get())
+        self.video_capture = _open_camera(self.camera_index.get())
         
         if not self.video_capture.isOpened():
             messagebox.showerror("Error", f"Could not open camera {self.camera_index.get()}")
             camera_window.destroy()
             return
         
+        self._start_frame_reader()
+        
         # Performance optimization variables
         process_frame_count = 0
         face_locations_cache = []
@@ -2881,124 +4147,271 @@ class FaceRecognitionApp:
         REQUIRED_DISPLAY_DETECTIONS = 3  # Require 3 consistent detections before showing name on screen (prevents flickering)
         DETECTION_TIMEOUT = 15  # Reset detection if face not seen for 15 frames
         
-        # Check date periodically and reset if new day
+        # Check the date now and again just after each midnight, resetting on a new day
         def check_date_reset():
             """Check if it's a new day and reset attendance if needed."""
+            if not self.camera_running or not camera_window.winfo_exists():
+                return
             today = date.today()
             if self.attendance_date != today:
-                self.seen_today = set()
+                with self._attendance_lock:
+                    self.seen_today = set()
                 self.attendance_date = today
                 attendance_listbox.delete(0, tk.END)
                 status_label.config(text=f"Smart Attendance Active (YOLOv11) - 0 student(s) marked (New Day)")
                 print(f"New day detected - Attendance automatically reset for {today}")
-            if self.camera_running:
-                camera_window.after(60000, check_date_reset)  # Check every minute
+            # Wake up once, a second after the next midnight (if the timer fires early the date
+            # hasn't changed yet and this simply re-arms for the few remaining seconds)
+            next_midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            delay_ms = int((next_midnight - datetime.now()).total_seconds() * 1000) + 1000
+            camera_window.after(delay_ms, check_date_reset)
         
         # Start date checking
         check_date_reset()
         
-        def update_frame():
-            nonlocal process_frame_count, face_locations_cache, face_names_cache, detection_history
+        # Detector handle, fetched on the first processed frame and again only after the model changes
+        detector = None
+        # Detection-size frame buffers reused by every processed frame, see _downscale_to_rgb
+        small_buffers = {}
+        
+        def invalidate_detector(*args):
+            nonlocal detector
+            detector = None
+        
+        self._trace_detection_model("attendance_detector", invalidate_detector)
+        
+        # Time the last frame was handed to the inference worker
+        last_submit = 0.0
+        
+        # Attendance photos waiting for photo_writer, as (frame, face_location, name, detect_scale, today_date)
+        photo_queue = queue.Queue()
+        # Next free filename suffix per (date folder, safe name), so only a name's first photo scans the folder
+        photo_suffixes = {}
+        # Scratch frame the writer annotates, reused while the camera resolution stays the same
+        # (only photo_writer draws on it, and it saves one photo at a time)
+        photo_buffers = {}
+        
+        def save_attendance_photo(frame, face_location, name, detect_scale, today_date):
+            """Save the frame a student was marked on, with their box, name and the date drawn in."""
+            try:
+                # Use relative path - users can change this to their preferred location
+                attendance_photos_base_dir = Path("attendance_photos")
+                
+                # Create a folder for today's date (YYYY-MM-DD format)
+                attendance_photos_dir = attendance_photos_base_dir / today_date
+                attendance_photos_dir.mkdir(parents=True, exist_ok=True)
+                
+                # Copy the frame into the scratch buffer to draw on
+                frame_to_save = photo_buffers.get("scratch")
+                if frame_to_save is None or frame_to_save.shape != frame.shape:
+                    frame_to_save = photo_buffers["scratch"] = np.empty_like(frame)
+                np.copyto(frame_to_save, frame)
+                
+                # Scale face location back to full frame size (detection was done on small_frame)
+                scale_factor = 1 / detect_scale
+                top = int(face_location[0] * scale_factor)
+                right = int(face_location[1] * scale_factor)
+                bottom = int(face_location[2] * scale_factor)
+                left = int(face_location[3] * scale_factor)
+                
+                # Draw bounding box (green for recognized person)
+                color = (0, 255, 0)  # Green
+                cv2.rectangle(frame_to_save, (left, top), (right, bottom), color, 3)
+                
+                # Draw name label with background
+                display_text = f"{name} ✓"
+                font = cv2.FONT_HERSHEY_DUPLEX
+                
+                # Draw background rectangle for name (same fixed strip height as the live overlay)
+                cv2.rectangle(
+                    frame_to_save, (left, bottom - NAME_LABEL_HEIGHT), (right, bottom), color, cv2.FILLED
+                )
+                
+                # Draw name text
+                cv2.putText(
+                    frame_to_save, display_text, (left + 6, bottom - 10),
+                    font, 0.7, (255, 255, 255), 2
+                )
+                
+                # Draw date in top-right corner
+                date_text = today_date
+                date_font = cv2.FONT_HERSHEY_SIMPLEX
+                date_text_size = _text_size(date_text, date_font, 0.8, 2)
+                
+                # Get frame dimensions
+                frame_height, frame_width = frame_to_save.shape[:2]
+                
+                # Position date in top-right corner with padding
+                date_x = frame_width - date_text_size[0] - 20
+                date_y = 35
+                
+                # Draw background rectangle for date
+                date_bg_padding = 10
+                cv2.rectangle(
+                    frame_to_save,
+                    (date_x - date_bg_padding, date_y - date_text_size[1] - date_bg_padding),
+                    (date_x + date_text_size[0] + date_bg_padding, date_y + date_bg_padding),
+                    (0, 0, 0),
+                    cv2.FILLED
+                )
+                
+                # Draw date text
+                cv2.putText(
+                    frame_to_save, date_text, (date_x, date_y),
+                    date_font, 0.8, (255, 255, 255), 2
+                )
+                
+                # Create filename from person's name (sanitize for filesystem)
+                safe_name = _safe_filename(name)
+                
+                # Use person's name as filename, add number if file exists
+                suffix_key = (today_date, safe_name)
+                counter = photo_suffixes.get(suffix_key)
+                if counter is None:
+                    # First photo of this name this session: skip past files left by earlier sessions
+                    filepath = attendance_photos_dir / f"{safe_name}.jpg"
+                    counter = 1
+                    while filepath.exists():
+                        filepath = attendance_photos_dir / f"{safe_name}_{counter}.jpg"
+                        counter += 1
+                else:
+                    filepath = attendance_photos_dir / f"{safe_name}_{counter}.jpg"
+                    counter += 1
+                photo_suffixes[suffix_key] = counter
+                
+                # Save the annotated frame (encoded in memory, written without waiting for a flush to disk)
+                filepath.write_bytes(_encode_jpeg(frame_to_save, ATTENDANCE_JPEG_QUALITY))
+                print(f"Saved attendance photo: {filepath}")
+            except Exception as e:
+                print(f"Warning: Could not save attendance photo for {name}: {e}")
+                import traceback
+                print(traceback.format_exc())
+        
+        def photo_writer():
+            """Draw and write queued attendance photos, finishing the queue after the camera stops."""
+            while self.camera_running or not photo_queue.empty():
+                try:
+                    job = photo_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                save_attendance_photo(*job)
+        
+        threading.Thread(target=photo_writer, daemon=True).start()
+        
+        def mark_in_sheet(names):
+            """Mark students present in the Google Sheet (runs on its own thread)."""
+            for name in names:
+                try:
+                    from attendance_sheet import mark_present
+                    mark_present(name)
+                except Exception as e:
+                    import traceback
+                    error_msg = f"Error marking attendance for {name}:\n{str(e)}\n\n{traceback.format_exc()}"
+                    print(error_msg)
+                    self.root.after(0, lambda name=name, err=str(e): messagebox.showerror(
+                        "Attendance Error", f"Failed to update Google Sheet for {name}:\n{err}"
+                    ))
+        
+        # Students marked by the worker but not yet shown; flush_marks moves them into the UI
+        pending_marks = deque()
+        
+        def flush_marks():
+            """Show newly marked students and send them to the Google Sheet, at most every ATTENDANCE_FLUSH_MS."""
+            names = []
+            while pending_marks:
+                names.append(pending_marks.popleft())
+            if names:
+                # One insert/see/config per batch instead of one round per student
+                attendance_listbox.insert(tk.END, *(f"✓ {name}" for name in names))
+                attendance_listbox.see(tk.END)
+                status_label.config(
+                    text=f"Smart Attendance Active (YOLOv11) - {len(self.seen_today)} student(s) marked"
+                )
+                # Mark in Google Sheet (non-blocking)
+                threading.Thread(target=mark_in_sheet, args=(names,), daemon=True).start()
+            if self.camera_running:
+                camera_window.after(ATTENDANCE_FLUSH_MS, flush_marks)
+        
+        def process_frame(job):
+            """Detect, recognize and vote on one frame (inference worker thread)."""
+            nonlocal detector
+            frame, detect_scale, model_name, encoding_model, current_frame = job
             
-            if not self.camera_running:
-                return
+            # Resize frame for faster processing (boxes are scaled back up when drawing).
+            # YOLO detects on the BGR frame directly; the RGB copy is only made for encoding
+            bgr_native = model_name in BGR_NATIVE_MODELS
+            if bgr_native:
+                small_frame = _downscale(frame, detect_scale, buffers=small_buffers)
+            else:
+                rgb_small_frame = _downscale_to_rgb(frame, detect_scale, buffers=small_buffers)
             
-            ret, frame = self.video_capture.read()
-            if not ret:
-                if self.camera_running:
-                    camera_window.after(33, update_frame)
-                return
+            # Get YOLOv11 detector (cached across frames, see invalidate_detector)
+            if detector is None:
+                detector = self.get_detector()
             
-            # Apply camera transformations
-            if self.camera_flip_horizontal.get():
-                frame = cv2.flip(frame, 1)
-            if self.camera_flip_vertical.get():
-                frame = cv2.flip(frame, 0)
-            rotation = self.camera_rotate.get()
-            if rotation == 90:
-                frame = cv2.rotate(frame, cv2.ROTATE_90_CLOCKWISE)
-            elif rotation == 180:
-                frame = cv2.rotate(frame, cv2.ROTATE_180)
-            elif rotation == 270:
-                frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
+            face_locations = []
+            face_names = []
             
-            # Process frames (same logic as Live Recognition)
-            process_frame_count += 1
-            should_process = (process_frame_count % 3 == 0)  # Process every 3rd frame
-                
-            if should_process:
-                # Resize frame for faster processing
-                small_frame = cv2.resize(frame, (0, 0), fx=0.4, fy=0.4)
-                rgb_small_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+            if detector:
+                try:
+                    # Detect faces using YOLOv11 detector (returns face locations directly)
+                    if bgr_native:
+                        face_locations = detector.detect_faces_cv2(small_frame)
+                    else:
+                        face_locations = detector.detect_faces(rgb_small_frame)
+                except Exception as e:
+                    _print_throttled("Face detection error", e)
+                    face_locations = []
+            
+            # Recognize faces with improved accuracy using detection history
+            current_encodings = self.loaded_encodings.get(model_name)
+            if current_encodings and face_locations:
+                # Get face encodings (same encoding model as training so distances are comparable)
+                if bgr_native:
+                    rgb_small_frame = _bgr_to_rgb(small_frame, small_buffers)
+                face_encodings = _face_encodings(
+                    rgb_small_frame, face_locations, model=encoding_model
+                )
                 
-                # Get YOLOv11 detector (already set at start of function)
-                detector = self.get_detector()
+                # Clean up old detection history (faces not seen recently)
+                for face_key in [
+                    face_key for face_key, history in detection_history.items()
+                    if current_frame - history["last_seen"] > DETECTION_TIMEOUT
+                ]:
+                    del detection_history[face_key]
                 
-                face_locations_cache = []
-                face_names_cache = []
+                # Recognize every face with stricter threshold (one batched distance computation)
+                recognized_names = self.recognize_faces_in_frame(face_encodings, model_name)
                 
-                if detector:
-                    try:
-                        # Detect faces using YOLOv11 detector (returns face locations directly)
-                        face_locations_cache = detector.detect_faces(rgb_small_frame)
-                    except Exception as e:
-                        print(f"Face detection error: {e}")
-                        face_locations_cache = []
+                # Use face locations as keys, rounded down to 10 px to handle small movements
+                # (one array op for all faces; astype truncates toward zero like int())
+                rounded = (np.asarray(face_locations, dtype=np.float32) / 10).astype(np.int32) * 10
+                face_keys = [tuple(face_key) for face_key in rounded.tolist()]
                 
-                # Recognize faces with improved accuracy using detection history
-                current_encodings = self.get_current_encodings()
-                if current_encodings and face_locations_cache:
-                    # Get face encodings
-                    face_encodings = face_recognition.face_encodings(
-                        rgb_small_frame, face_locations_cache
-                    )
+                # Process each detected face
+                for face_location, face_key, name in zip(face_locations, face_keys, recognized_names):
                     
-                    # Clean up old detection history (faces not seen recently)
-                    current_frame = process_frame_count
-                    keys_to_remove = []
-                    for face_key, history in detection_history.items():
-                        if current_frame - history["last_seen"] > DETECTION_TIMEOUT:
-                            keys_to_remove.append(face_key)
-                    for key in keys_to_remove:
-                        del detection_history[key]
+                    name = name if name else "Unknown"
                     
-                    # Process each detected face
-                    for idx, (face_location, face_encoding) in enumerate(zip(face_locations_cache, face_encodings)):
-                        # Use face location as key (rounded to handle small movements)
-                        face_key = tuple(int(coord / 10) * 10 for coord in face_location)
-                        
-                        # Recognize the face with stricter threshold
-                        name = self.recognize_face_in_frame(face_encoding)
-                        name = name if name else "Unknown"
-                        
-                        # Update detection history
-                        if name != "Unknown":
-                            if face_key in detection_history:
-                                # Check if same person
-                                if detection_history[face_key]["name"] == name:
-                                    # Increment count
-                                    detection_history[face_key]["count"] += 1
-                                    detection_history[face_key]["last_seen"] = current_frame
-                                    
-                                    # Update display name only after consistent detections (prevents flickering)
-                                    if detection_history[face_key]["count"] >= REQUIRED_DISPLAY_DETECTIONS:
-                                        # Stable detection - update display name
-                                        if detection_history[face_key].get("display_name") != name:
-                                            detection_history[face_key]["display_name"] = name
-                                            detection_history[face_key]["display_count"] = 1
-                                        else:
-                                            detection_history[face_key]["display_count"] += 1
-                                else:
-                                    # Different person detected at same location - reset completely
-                                    detection_history[face_key] = {
-                                        "name": name,
-                                        "count": 1,
-                                        "display_name": "Unknown",  # Don't show name until stable
-                                        "display_count": 0,
-                                        "last_seen": current_frame
-                                    }
+                    # Update detection history
+                    if name != "Unknown":
+                        if face_key in detection_history:
+                            # Check if same person
+                            if detection_history[face_key]["name"] == name:
+                                # Increment count
+                                detection_history[face_key]["count"] += 1
+                                detection_history[face_key]["last_seen"] = current_frame
+                                
+                                # Update display name only after consistent detections (prevents flickering)
+                                if detection_history[face_key]["count"] >= REQUIRED_DISPLAY_DETECTIONS:
+                                    # Stable detection - update display name
+                                    if detection_history[face_key].get("display_name") != name:
+                                        detection_history[face_key]["display_name"] = name
+                                        detection_history[face_key]["display_count"] = 1
+                                    else:
+                                        detection_history[face_key]["display_count"] += 1
                             else:
-                                # New face detected - start with "Unknown" display
+                                # Different person detected at same location - reset completely
                                 detection_history[face_key] = {
                                     "name": name,
                                     "count": 1,
@@ -3006,175 +4419,105 @@ class FaceRecognitionApp:
                                     "display_count": 0,
                                     "last_seen": current_frame
                                 }
-                            
-                            # Get the display name (stabilized)
-                            display_name = detection_history[face_key].get("display_name", "Unknown")
-                            face_names_cache.append(display_name)
-                            
-                            # Only mark attendance after many consistent detections (high accuracy requirement)
-                            if (detection_history[face_key]["count"] >= REQUIRED_CONSISTENT_DETECTIONS and 
-                                name not in self.seen_today):
-                                self.seen_today.add(name)
-                                # Update UI
-                                attendance_listbox.insert(tk.END, f"✓ {name}")
-                                attendance_listbox.see(tk.END)
-                                status_label.config(
-                                    text=f"Smart Attendance Active (YOLOv11) - {len(self.seen_today)} student(s) marked"
-                                )
-                                
-                                # Save the frame when marking attendance (with face recognition box and date)
-                                try:
-                                    # Use relative path - users can change this to their preferred location
-                                    attendance_photos_base_dir = Path("attendance_photos")
-                                    
-                                    # Create a folder for today's date (YYYY-MM-DD format)
-                                    today_date = date.today().strftime("%Y-%m-%d")
-                                    attendance_photos_dir = attendance_photos_base_dir / today_date
-                                    attendance_photos_dir.mkdir(parents=True, exist_ok=True)
-                                    
-                                    # Create a copy of the frame to draw on
-                                    frame_to_save = frame.copy()
-                                    
-                                    # Scale face location back to full frame size (detection was done on small_frame)
-                                    scale_factor = 1 / 0.4
-                                    top = int(face_location[0] * scale_factor)
-                                    right = int(face_location[1] * scale_factor)
-                                    bottom = int(face_location[2] * scale_factor)
-                                    left = int(face_location[3] * scale_factor)
-                                    
-                                    # Draw bounding box (green for recognized person)
-                                    color = (0, 255, 0)  # Green
-                                    cv2.rectangle(frame_to_save, (left, top), (right, bottom), color, 3)
-                                    
-                                    # Draw name label with background
-                                    display_text = f"{name} ✓"
-                                    font = cv2.FONT_HERSHEY_DUPLEX
-                                    text_size = cv2.getTextSize(display_text, font, 0.7, 2)[0]
-                                    text_height = text_size[1] + 10
-                                    
-                                    # Draw background rectangle for name
-                                    cv2.rectangle(
-                                        frame_to_save, (left, bottom - text_height), (right, bottom), color, cv2.FILLED
-                                    )
-                                    
-                                    # Draw name text
-                                    cv2.putText(
-                                        frame_to_save, display_text, (left + 6, bottom - 10),
-                                        font, 0.7, (255, 255, 255), 2
-                                    )
-                                    
-                                    # Draw date in top-right corner
-                                    date_text = today_date
-                                    date_font = cv2.FONT_HERSHEY_SIMPLEX
-                                    date_text_size = cv2.getTextSize(date_text, date_font, 0.8, 2)[0]
-                                    
-                                    # Get frame dimensions
-                                    frame_height, frame_width = frame_to_save.shape[:2]
-                                    
-                                    # Position date in top-right corner with padding
-                                    date_x = frame_width - date_text_size[0] - 20
-                                    date_y = 35
-                                    
-                                    # Draw background rectangle for date
-                                    date_bg_padding = 10
-                                    cv2.rectangle(
-                                        frame_to_save,
-                                        (date_x - date_bg_padding, date_y - date_text_size[1] - date_bg_padding),
-                                        (date_x + date_text_size[0] + date_bg_padding, date_y + date_bg_padding),
-                                        (0, 0, 0),
-                                        cv2.FILLED
-                                    )
-                                    
-                                    # Draw date text
-                                    cv2.putText(
-                                        frame_to_save, date_text, (date_x, date_y),
-                                        date_font, 0.8, (255, 255, 255), 2
-                                    )
-                                    
-                                    # Create filename from person's name (sanitize for filesystem)
-                                    safe_name = "".join(c for c in name if c.isalnum() or c in (' ', '-', '_')).strip()
-                                    safe_name = safe_name.replace(' ', '_')
-                                    
-                                    # Use person's name as filename, add number if file exists
-                                    base_filename = f"{safe_name}.jpg"
-                                    filepath = attendance_photos_dir / base_filename
-                                    
-                                    # If file exists, add a number suffix
-                                    counter = 1
-                                    while filepath.exists():
-                                        filename_with_counter = f"{safe_name}_{counter}.jpg"
-                                        filepath = attendance_photos_dir / filename_with_counter
-                                        counter += 1
-                                    
-                                    # Save the annotated frame
-                                    cv2.imwrite(str(filepath), frame_to_save)
-                                    print(f"Saved attendance photo: {filepath}")
-                                except Exception as e:
-                                    print(f"Warning: Could not save attendance photo for {name}: {e}")
-                                    import traceback
-                                    print(traceback.format_exc())
-                                
-                                # Mark in Google Sheet (non-blocking)
-                                try:
-                                    from attendance_sheet import mark_present
-                                    print(f"Marking '{name}' as present (confirmed after {detection_history[face_key]['count']} detections)")
-                                    mark_present(name)
-                                except Exception as e:
-                                    import traceback
-                                    error_msg = f"Error marking attendance for {name}:\n{str(e)}\n\n{traceback.format_exc()}"
-                                    print(error_msg)
-                                    messagebox.showerror("Attendance Error", f"Failed to update Google Sheet for {name}:\n{str(e)}")
                         else:
-                            # Unknown face - reset display but keep history for a bit (in case it's temporary)
-                            if face_key in detection_history:
-                                # If we had a name before, reset display but keep counting
-                                if detection_history[face_key].get("display_name") != "Unknown":
-                                    detection_history[face_key]["display_name"] = "Unknown"
-                                    detection_history[face_key]["display_count"] = 0
-                                # Reset the name count if too many unknowns
-                                if detection_history[face_key]["count"] > 0:
-                                    detection_history[face_key]["count"] = max(0, detection_history[face_key]["count"] - 2)  # Decay faster
-                            face_names_cache.append("Unknown")
+                            # New face detected - start with "Unknown" display
+                            detection_history[face_key] = {
+                                "name": name,
+                                "count": 1,
+                                "display_name": "Unknown",  # Don't show name until stable
+                                "display_count": 0,
+                                "last_seen": current_frame
+                            }
+                        
+                        # Get the display name (stabilized)
+                        display_name = detection_history[face_key].get("display_name", "Unknown")
+                        face_names.append(display_name)
+                        
+                        # Only mark attendance after many consistent detections (high accuracy requirement).
+                        # The check and add happen under the lock so a reset on the Tk thread can't interleave
+                        if detection_history[face_key]["count"] < REQUIRED_CONSISTENT_DETECTIONS:
+                            continue
+                        with self._attendance_lock:
+                            if name in self.seen_today:
+                                continue
+                            self.seen_today.add(name)
+                        print(f"Marking '{name}' as present (confirmed after {detection_history[face_key]['count']} detections)")
+                        
+                        # Save the frame when marking attendance (with face recognition box and date,
+                        # filed under the attendance day so photos and the list roll over together).
+                        # The worker owns this frame and never draws on it, so the writer can take it as is
+                        photo_queue.put((frame, face_location, name, detect_scale, self.attendance_date.isoformat()))
+                        
+                        # Shown by flush_marks on the Tk thread
+                        pending_marks.append(name)
+                    else:
+                        # Unknown face - reset display but keep history for a bit (in case it's temporary)
+                        if face_key in detection_history:
+                            # If we had a name before, reset display but keep counting
+                            if detection_history[face_key].get("display_name") != "Unknown":
+                                detection_history[face_key]["display_name"] = "Unknown"
+                                detection_history[face_key]["display_count"] = 0
+                            # Reset the name count if too many unknowns
+                            if detection_history[face_key]["count"] > 0:
+                                detection_history[face_key]["count"] = max(0, detection_history[face_key]["count"] - 2)  # Decay faster
+                        face_names.append("Unknown")
             
-            # Always draw on full-size frame (even if not processing this frame)
-            scale_factor = 1 / 0.4
+            # Names only exist for faces that went through recognition
+            if len(face_names) != len(face_locations):
+                face_locations = []
+            return _scale_boxes(face_locations, detect_scale).tolist(), face_names
+        
+        self._inference_worker = _LatestJobWorker(process_frame)
+        flush_marks()
+        
+        def update_frame():
+            nonlocal process_frame_count, face_locations_cache, face_names_cache, last_submit
             
-            for (top, right, bottom, left), name in zip(face_locations_cache, face_names_cache):
-                top = int(top * scale_factor)
-                right = int(right * scale_factor)
-                bottom = int(bottom * scale_factor)
-                left = int(left * scale_factor)
-                
-                # Green for recognized, red for unknown
-                color = (0, 255, 0) if name != "Unknown" else (0, 0, 255)
-                cv2.rectangle(frame, (left, top), (right, bottom), color, 3)
-                
-                # Draw name label
-                display_text = name
-                if name != "Unknown" and name in self.seen_today:
-                    display_text = f"{name} ✓"
-                
-                text_size = cv2.getTextSize(display_text, cv2.FONT_HERSHEY_DUPLEX, 0.7, 2)[0]
-                text_height = text_size[1] + 10
-                
-                cv2.rectangle(
-                    frame, (left, bottom - text_height), (right, bottom), color, cv2.FILLED
-                )
-                
-                font = cv2.FONT_HERSHEY_DUPLEX
-                cv2.putText(
-                    frame, display_text, (left + 6, bottom - 10),
-                    font, 0.7, (255, 255, 255), 2
-                )
+            if not self.camera_running:
+                return
             
-            # Always display frame (even if not processing faces this frame)
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            img = Image.fromarray(frame_rgb)
-            img = img.resize((880, 660), Image.Resampling.LANCZOS)
-            imgtk = ImageTk.PhotoImage(image=img)
+            ret, frame = self._read_latest_frame()
+            if not ret:
+                if self.camera_running:
+                    camera_window.after(33, update_frame)
+                return
+            
+            # Apply camera transformations (flip/rotate, combined into at most two passes)
+            frame = _apply_steps(frame, self._orientation)
+            
+            # Process frames (same logic as Live Recognition): only send every Nth frame to the
+            # worker, and no faster than it has been getting through them
+            process_frame_count += 1
+            now = time.perf_counter()
+            if (
+                process_frame_count % self._get_detect_every() == 0
+                and now - last_submit >= (self._inference_worker.latency or 0.0)
+            ):
+                last_submit = now
+                # The worker gets its own copy - this frame is drawn on below
+                self._inference_worker.submit((
+                    frame.copy(),
+                    self._get_detect_scale(),
+                    self._model_name,
+                    self._encoding_model,
+                    process_frame_count,
+                ))
             
-            video_label.imgtk = imgtk
-            video_label.config(image=imgtk)
+            # Pick up the newest finished detection
+            result = self._inference_worker.result
+            if result is not None:
+                face_locations_cache, face_names_cache = result
+            
+            # Always draw on full-size frame (even if not processing this frame)
+            # Green for recognized, red for unknown; marked students get a tick
+            display_texts = [
+                f"{name} ✓" if name != "Unknown" and name in self.seen_today else name
+                for name in face_names_cache
+            ]
+            _draw_face_boxes(frame, face_locations_cache, face_names_cache, display_texts)
+            
+            # Always display frame (even if not processing faces this frame)
+            self._show_frame(video_label, frame, (880, 660))
             
             if self.camera_running:
                 camera_window.after(33, update_frame)
@@ -3194,8 +4537,9 @@ class FaceRecognitionApp:
             present_students = get_present_students()
             
             # Update seen_today with students found in spreadsheet
-            new_students = present_students - self.seen_today
-            self.seen_today.update(present_students)
+            with self._attendance_lock:
+                new_students = present_students - self.seen_today
+                self.seen_today.update(present_students)
             
             # Update listbox
             listbox.delete(0, tk.END)
@@ -3227,7 +4571,8 @@ class FaceRecognitionApp:
     
     def _reset_attendance(self, listbox, status_label):
         """Reset today's attendance tracking."""
-        self.seen_today = set()
+        with self._attendance_lock:
+            self.seen_today = set()
         listbox.delete(0, tk.END)
         status_label.config(text="Smart Attendance Active (YOLOv11) - 0 student(s) marked")
         print("Attendance reset - students can be marked again")
@@ -3485,8 +4830,8 @@ class FaceRecognitionApp:
                 
                 # Configure tags if not already done
                 if not hasattr(self, '_transcript_tags_configured'):
-                    self.live_api_transcript_text.tag_config("user", foreground=COLORS["accent_purple"], font=("Segoe UI", 9, "bold"))
-                    self.live_api_transcript_text.tag_config("response", foreground=COLORS["accent_blue"], font=("Segoe UI", 9, "bold"))
+                    self.live_api_transcript_text.tag_config("user", foreground=COLORS["accent_purple"], font=_tk_font(9, "bold"))
+                    self.live_api_transcript_text.tag_config("response", foreground=COLORS["accent_blue"], font=_tk_font(9, "bold"))
                     self._transcript_tags_configured = True
                 
                 # Get current content
@@ -3520,26 +4865,51 @@ class FaceRecognitionApp:
                 import traceback
                 traceback.print_exc()
     
+    def _read_gemini_api_key(self):
+        """Read the saved Gemini API key from the OS keyring or the key file (no Tk calls)."""
+        if KEYRING_AVAILABLE:
+            try:
+                api_key = keyring.get_password(KEYRING_SERVICE, KEYRING_USERNAME)
+                if api_key:
+                    print(f"✓ Gemini API key loaded from system keyring (length: {len(api_key)} characters)")
+                    return api_key.strip()
+            except Exception as e:
+                print(f"⚠️ Could not read Gemini API key from keyring: {e}")
+        
+        key_file = GEMINI_KEY_FILE
+        if key_file.exists():
+            with key_file.open("r", encoding="utf-8") as f:
+                api_key = f.read().strip()
+            if api_key:
+                print(f"✓ Gemini API key loaded successfully (length: {len(api_key)} characters)")
+                print(f"   File location: {key_file.absolute()}")
+            else:
+                print("⚠️ API key file exists but is empty")
+            return api_key
+        
+        print(f"ℹ️ No saved API key found at: {key_file.absolute()}")
+        print("   Please set it in Settings.")
+        return None
+    
+    def _async_load_gemini_key(self):
+        """Load the Gemini API key on a background thread and hand it to Tk."""
+        try:
+            api_key = self._read_gemini_api_key()
+        except Exception as e:
+            print(f"❌ Error loading Gemini API key: {e}")
+            return
+        if api_key:
+            # Don't overwrite a key the user has already started typing
+            self.root.after(0, lambda v=api_key: self.gemini_api_key.get() or self.gemini_api_key.set(v))
+    
     def load_gemini_api_key(self):
-        """Load Gemini API key from file if exists."""
+        """Load Gemini API key from the keyring or file if it exists."""
         try:
-            key_file = Path("output/gemini_api_key.txt")
-            if key_file.exists():
-                with key_file.open("r", encoding="utf-8") as f:
-                    api_key = f.read().strip()
-                    if api_key:
-                        self.gemini_api_key.set(api_key)
-                        print(f"✓ Gemini API key loaded successfully (length: {len(api_key)} characters)")
-                        print(f"   File location: {key_file.absolute()}")
-                        return True
-                    else:
-                        print("⚠️ API key file exists but is empty")
-                        self.gemini_api_key.set("")  # Set to empty
-                        return False
-            else:
-                print(f"ℹ️ No saved API key found at: {key_file.absolute()}")
-                print("   Please set it in Settings.")
+            api_key = self._read_gemini_api_key()
+            if api_key is None:
                 return False
+            self.gemini_api_key.set(api_key)
+            return bool(api_key)
         except Exception as e:
             print(f"❌ Error loading Gemini API key: {e}")
             import traceback
@@ -3547,12 +4917,30 @@ class FaceRecognitionApp:
             return False
     
     def save_gemini_api_key(self):
-        """Save Gemini API key to file."""
+        """Save Gemini API key to the OS keyring, or to file if no keyring is available."""
         try:
-            output_dir = Path("output")
-            output_dir.mkdir(exist_ok=True)
-            key_file = output_dir / "gemini_api_key.txt"
             api_key = self.gemini_api_key.get().strip()
+            key_file = GEMINI_KEY_FILE
+            
+            if KEYRING_AVAILABLE:
+                try:
+                    if api_key:
+                        keyring.set_password(KEYRING_SERVICE, KEYRING_USERNAME, api_key)
+                        print(f"✓ Gemini API key saved to system keyring (length: {len(api_key)} characters)")
+                    else:
+                        try:
+                            keyring.delete_password(KEYRING_SERVICE, KEYRING_USERNAME)
+                        except keyring.errors.PasswordDeleteError:
+                            pass
+                        print("✓ API key cleared from system keyring")
+                    # The keyring is now the source of truth - drop any plaintext copy
+                    if key_file.exists():
+                        key_file.unlink()
+                    return True
+                except Exception as e:
+                    print(f"⚠️ Could not save API key to keyring, falling back to file: {e}")
+            
+            key_file.parent.mkdir(exist_ok=True)
             
             # Write the API key to file
             with key_file.open("w", encoding="utf-8") as f:
@@ -3602,9 +4990,7 @@ class FaceRecognitionApp:
         
         if file_path:
             file_ext = Path(file_path).suffix.lower()
-            video_extensions = {'.mp4', '.avi', '.mov', '.mkv'}
-            
-            if file_ext in video_extensions:
+            if file_ext in VIDEO_EXTS:
                 # Process video
                 self.test_video(file_path)
             else:
@@ -3617,7 +5003,7 @@ class FaceRecognitionApp:
                     
                     # Get encoding model type (HOG -> small, CNN -> large)
                     encoding_model = "small" if self.model_type.get() == "hog" else "large"
-                    face_encodings = face_recognition.face_encodings(
+                    face_encodings = _face_encodings(
                         image, face_locations, model=encoding_model
                     )
                     
@@ -3642,8 +5028,9 @@ class FaceRecognitionApp:
                         except:
                             pass
                     
-                    for bounding_box, unknown_encoding in zip(face_locations, face_encodings):
-                        name = self.recognize_face_in_frame(unknown_encoding)
+                    # Match every face in one batched distance computation
+                    recognized_names = self.recognize_faces_in_frame(face_encodings)
+                    for bounding_box, name in zip(face_locations, recognized_names):
                         if not name:
                             name = "Unknown"
                         
@@ -3661,20 +5048,15 @@ class FaceRecognitionApp:
                                 # Extract face region
                                 face_roi = image[top:bottom, left:right]
                                 if face_roi.size > 0:
-                                    import tempfile
-                                    import os
-                                    temp_fd, temp_path = tempfile.mkstemp(suffix='.jpg')
-                                    os.close(temp_fd)
-                                    Image.fromarray(face_roi).save(temp_path, 'JPEG')
-                                    
+                                    # DeepFace takes numpy input as BGR, like an image it read from disk
                                     analysis = deepface_analyzer.analyze_face(
-                                        temp_path,
+                                        cv2.cvtColor(face_roi, cv2.COLOR_RGB2BGR),
                                         actions=['emotion', 'age', 'gender', 'race']
                                     )
                                     
                                     if analysis:
                                         # Apply calibration if available
-                                        if self.deepface_calibrator and name != "Unknown":
+                                        if self._get_calibrator() and name != "Unknown":
                                             try:
                                                 analysis = self.deepface_calibrator.calibrate_result(name, analysis)
                                             except Exception as e:
@@ -3686,8 +5068,6 @@ class FaceRecognitionApp:
                                         race = analysis.get('dominant_race', 'N/A')
                                         
                                         display_text = f"{name}\n{emotion} | {age}y | {gender} | {race}"
-                                    
-                                    os.remove(temp_path)
                             except:
                                 pass
                         
@@ -3757,7 +5137,7 @@ class FaceRecognitionApp:
         status_label = tk.Label(
             control_frame,
             text="🎬 Processing Video...",
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         )
@@ -3769,7 +5149,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=lambda: self.stop_video_processing(video_window),
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -3791,6 +5171,7 @@ class FaceRecognitionApp:
                 frame_delay = int(1000 / fps) if fps > 0 else 33
                 
                 detector = self.get_detector()
+                small_buffers = {}  # Reused half-size frames, see _downscale_to_rgb
                 
                 def process_next_frame():
                     if not self.video_processing:
@@ -3805,50 +5186,28 @@ class FaceRecognitionApp:
                         return
                     
                     # Resize for faster processing
-                    small_frame = cv2.resize(frame, (0, 0), fx=0.5, fy=0.5)
-                    rgb_small_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB)
+                    rgb_small_frame = _downscale_to_rgb(
+                        frame, 0.5, interpolation=cv2.INTER_LINEAR, buffers=small_buffers
+                    )
                     
                     # Detect and recognize faces
                     face_locations = detector.detect_faces(rgb_small_frame)
                     # Get encoding model type (HOG -> small, CNN -> large)
-                    encoding_model = "small" if self.model_type.get() == "hog" else "large"
-                    face_encodings = face_recognition.face_encodings(
+                    encoding_model = self._encoding_model
+                    face_encodings = _face_encodings(
                         rgb_small_frame, face_locations, model=encoding_model
                     )
                     
-                    face_names = []
-                    for face_encoding in face_encodings:
-                        name = self.recognize_face_in_frame(face_encoding)
-                        face_names.append(name if name else "Unknown")
+                    face_names = [
+                        name if name else "Unknown"
+                        for name in self.recognize_faces_in_frame(face_encodings, self._model_name)
+                    ]
                     
                     # Draw on full frame
-                    scale_factor = 2
-                    for (top, right, bottom, left), name in zip(face_locations, face_names):
-                        top = int(top * scale_factor)
-                        right = int(right * scale_factor)
-                        bottom = int(bottom * scale_factor)
-                        left = int(left * scale_factor)
-                        
-                        color = (0, 255, 0) if name != "Unknown" else (0, 0, 255)
-                        cv2.rectangle(frame, (left, top), (right, bottom), color, 3)
-                        
-                        cv2.rectangle(
-                            frame, (left, bottom - 40), (right, bottom), color, cv2.FILLED
-                        )
-                        font = cv2.FONT_HERSHEY_DUPLEX
-                        cv2.putText(
-                            frame, name, (left + 6, bottom - 10),
-                            font, 0.7, (255, 255, 255), 2
-                        )
+                    _draw_face_boxes(frame, _scale_boxes(face_locations, 0.5), face_names, label_height=40)
                     
                     # Display frame
-                    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                    img = Image.fromarray(frame_rgb)
-                    img = img.resize((980, 600), Image.Resampling.LANCZOS)
-                    imgtk = ImageTk.PhotoImage(image=img)
-                    
-                    video_label.imgtk = imgtk
-                    video_label.config(image=imgtk)
+                    self._show_frame(video_label, frame, (980, 600))
                     
                     # Schedule next frame
                     video_window.after(frame_delay, process_next_frame)
@@ -3895,7 +5254,7 @@ class FaceRecognitionApp:
         info_label = tk.Label(
             info_frame,
             text=f"📄 {file_name}",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_secondary"]
         )
@@ -3910,7 +5269,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=lambda: self.save_result_image(image, original_path),
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -3924,7 +5283,7 @@ class FaceRecognitionApp:
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             command=result_window.destroy,
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=15,
@@ -3969,7 +5328,7 @@ class FaceRecognitionApp:
         tk.Label(
             header,
             text="Registered People",
-            font=("Segoe UI", 24, "bold"),
+            font=_tk_font(24, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
             pady=28
@@ -3984,7 +5343,7 @@ class FaceRecognitionApp:
         listbox = tk.Listbox(
             content,
             yscrollcommand=scrollbar.set,
-            font=("Segoe UI", 12),
+            font=_tk_font(12),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             selectbackground=COLORS["accent_blue"],
@@ -4012,7 +5371,7 @@ class FaceRecognitionApp:
             command=window.destroy,
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -4036,7 +5395,7 @@ class FaceRecognitionApp:
         tk.Label(
             header,
             text="⚙️ Settings",
-            font=("Segoe UI", 20, "bold"),
+            font=_tk_font(20, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
             pady=20
@@ -4052,7 +5411,7 @@ class FaceRecognitionApp:
         tk.Label(
             camera_frame,
             text="Camera Index",
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=20, pady=(15, 5))
@@ -4063,7 +5422,7 @@ class FaceRecognitionApp:
         tk.Label(
             spinbox_frame,
             text="Device:",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_secondary"]
         ).pack(side=tk.LEFT)
@@ -4074,7 +5433,7 @@ class FaceRecognitionApp:
             to=5,
             textvariable=self.camera_index,
             width=10,
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             buttonbackground=COLORS["accent_blue"],
@@ -4082,6 +5441,82 @@ class FaceRecognitionApp:
         )
         camera_spinbox.pack(side=tk.RIGHT)
         
+        # Detection scale
+        scale_frame = tk.Frame(content, bg=COLORS["bg_secondary"], relief=tk.FLAT)
+        scale_frame.pack(pady=15, padx=0, fill=tk.X)
+        
+        tk.Label(
+            scale_frame,
+            text="Detection Scale",
+            font=_tk_font(11, "bold"),
+            bg=COLORS["bg_secondary"],
+            fg=COLORS["text_primary"]
+        ).pack(anchor=tk.W, padx=20, pady=(15, 5))
+        
+        scale_spinbox_frame = tk.Frame(scale_frame, bg=COLORS["bg_secondary"])
+        scale_spinbox_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
+        
+        tk.Label(
+            scale_spinbox_frame,
+            text="Lower = faster, higher = finds smaller faces:",
+            font=_tk_font(10),
+            bg=COLORS["bg_secondary"],
+            fg=COLORS["text_secondary"]
+        ).pack(side=tk.LEFT)
+        
+        scale_spinbox = tk.Spinbox(
+            scale_spinbox_frame,
+            from_=0.2,
+            to=1.0,
+            increment=0.1,
+            format="%.1f",
+            textvariable=self.detect_scale,
+            width=10,
+            font=_tk_font(10),
+            bg=COLORS["bg_tertiary"],
+            fg=COLORS["text_primary"],
+            buttonbackground=COLORS["accent_blue"],
+            relief=tk.FLAT
+        )
+        scale_spinbox.pack(side=tk.RIGHT)
+        
+        # Detection interval
+        interval_frame = tk.Frame(content, bg=COLORS["bg_secondary"], relief=tk.FLAT)
+        interval_frame.pack(pady=15, padx=0, fill=tk.X)
+        
+        tk.Label(
+            interval_frame,
+            text="Detect Every N Frames",
+            font=_tk_font(11, "bold"),
+            bg=COLORS["bg_secondary"],
+            fg=COLORS["text_primary"]
+        ).pack(anchor=tk.W, padx=20, pady=(15, 5))
+        
+        interval_spinbox_frame = tk.Frame(interval_frame, bg=COLORS["bg_secondary"])
+        interval_spinbox_frame.pack(fill=tk.X, padx=20, pady=(0, 15))
+        
+        tk.Label(
+            interval_spinbox_frame,
+            text="Higher = smoother video, boxes update less often:",
+            font=_tk_font(10),
+            bg=COLORS["bg_secondary"],
+            fg=COLORS["text_secondary"]
+        ).pack(side=tk.LEFT)
+        
+        interval_spinbox = tk.Spinbox(
+            interval_spinbox_frame,
+            from_=1,
+            to=10,
+            textvariable=self.detect_every,
+            width=10,
+            font=_tk_font(10),
+            bg=COLORS["bg_tertiary"],
+            fg=COLORS["text_primary"],
+            buttonbackground=COLORS["accent_blue"],
+            relief=tk.FLAT
+        )
+        interval_spinbox.pack(side=tk.RIGHT)
+        
         # Model type
         model_frame = tk.Frame(content, bg=COLORS["bg_secondary"], relief=tk.FLAT)
         model_frame.pack(pady=15, padx=0, fill=tk.X)
@@ -4089,7 +5524,7 @@ class FaceRecognitionApp:
         tk.Label(
             model_frame,
             text="🤖 Detection Model:",
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(anchor=tk.W, padx=20, pady=(15, 10))
@@ -4102,7 +5537,7 @@ class FaceRecognitionApp:
             text="HOG (CPU - Faster)",
             variable=self.model_type,
             value="hog",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
             selectcolor=COLORS["bg_tertiary"],
@@ -4115,7 +5550,7 @@ class FaceRecognitionApp:
             text="CNN (GPU - More Accurate)",
             variable=self.model_type,
             value="cnn",
-            font=("Segoe UI", 10),
+            font=_tk_font(10),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"],
             selectcolor=COLORS["bg_tertiary"],
@@ -4130,7 +5565,7 @@ class FaceRecognitionApp:
         tk.Label(
             gemini_header_frame,
             text="🤖 Gemini API Key (For Live Voice Calls)",
-            font=("Segoe UI", 12, "bold"),
+            font=_tk_font(12, "bold"),
             bg=COLORS["accent_blue"],
             fg=COLORS["text_primary"],
             pady=10
@@ -4142,7 +5577,7 @@ class FaceRecognitionApp:
         tk.Label(
             gemini_frame,
             text="Enter your Google Gemini API key to enable live voice calls:",
-            font=("Segoe UI", 9),
+            font=_tk_font(9),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_secondary"]
         ).pack(anchor=tk.W, padx=20, pady=(15, 5))
@@ -4150,7 +5585,7 @@ class FaceRecognitionApp:
         tk.Label(
             gemini_frame,
             text="Get your free API key from: https://makersuite.google.com/app/apikey",
-            font=("Segoe UI", 8),
+            font=_tk_font(8),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_secondary"],
             cursor="hand2"
@@ -4163,7 +5598,7 @@ class FaceRecognitionApp:
         tk.Label(
             entry_frame,
             text="API Key:",
-            font=("Segoe UI", 10, "bold"),
+            font=_tk_font(10, "bold"),
             bg=COLORS["bg_secondary"],
             fg=COLORS["text_primary"]
         ).pack(side=tk.LEFT, padx=(0, 10))
@@ -4171,7 +5606,7 @@ class FaceRecognitionApp:
         gemini_entry = tk.Entry(
             entry_frame,
             textvariable=self.gemini_api_key,
-            font=("Segoe UI", 11),
+            font=_tk_font(11),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             insertbackground=COLORS["text_primary"],
@@ -4194,7 +5629,7 @@ class FaceRecognitionApp:
             entry_frame,
             text="👁️ Show",
             command=toggle_show_key,
-            font=("Segoe UI", 8),
+            font=_tk_font(8),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
             relief=tk.FLAT,
@@ -4210,7 +5645,7 @@ class FaceRecognitionApp:
         status_label = tk.Label(
             gemini_frame,
             text=api_key_status_text,
-            font=("Segoe UI", 9, "bold"),
+            font=_tk_font(9, "bold"),
             bg=COLORS["bg_secondary"],
             fg=api_key_status_color
         )
@@ -4241,7 +5676,7 @@ class FaceRecognitionApp:
             command=lambda: self.save_settings(window),
             bg=COLORS["bg_tertiary"],
             fg=COLORS["text_primary"],
-            font=("Segoe UI", 11, "bold"),
+            font=_tk_font(11, "bold"),
             relief=tk.FLAT,
             cursor="hand2",
             padx=20,
@@ -4297,4 +5732,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Needed for the training process pool in frozen (PyInstaller) Windows builds
+    multiprocessing.freeze_support()
     main()
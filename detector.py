@@ -90,9 +90,11 @@ def encode_known_faces(
 
 def _recognize_face(unknown_encoding, loaded_encodings):
     """Compare unknown face encoding with known encodings and return best match."""
-    boolean_matches = face_recognition.compare_faces(
-        loaded_encodings["encodings"], unknown_encoding
+    # Same test as face_recognition.compare_faces (tolerance 0.6), against the stacked matrix
+    distances = np.linalg.norm(
+        loaded_encodings["matrix"] - np.asarray(unknown_encoding, dtype=np.float32), axis=1
     )
+    boolean_matches = distances <= 0.6
     votes = Counter(
         name
         for match, name in zip(boolean_matches, loaded_encodings["names"])
@@ -110,6 +112,11 @@ def recognize_faces(
     """Recognize faces in an image and display results."""
     with encodings_location.open(mode="rb") as f:
         loaded_encodings = pickle.load(f)
+    # Stack once into a contiguous float32 matrix so each lookup is one vectorized pass
+    # (reshape keeps an empty encodings file a (0, 128) matrix that matches nothing)
+    loaded_encodings["matrix"] = np.ascontiguousarray(
+        np.asarray(loaded_encodings["encodings"], dtype=np.float32).reshape(-1, 128)
+    )
 
     # Convert image to RGB format
     input_image = convert_image_to_rgb(image_location)
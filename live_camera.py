@@ -14,6 +14,11 @@ def load_encodings(encodings_location: Path = DEFAULT_ENCODINGS_PATH):
     try:
         with encodings_location.open(mode="rb") as f:
             loaded_encodings = pickle.load(f)
+        # Stack once into a contiguous float32 matrix so each lookup is one vectorized pass
+        # (reshape keeps an empty encodings file a (0, 128) matrix that matches nothing)
+        loaded_encodings["matrix"] = np.ascontiguousarray(
+            np.asarray(loaded_encodings["encodings"], dtype=np.float32).reshape(-1, 128)
+        )
         print(f"Loaded encodings for {len(set(loaded_encodings['names']))} person(s)")
         return loaded_encodings
     except FileNotFoundError:
@@ -26,9 +31,11 @@ def recognize_face_in_frame(face_encoding, loaded_encodings):
     """Compare face encoding with known encodings and return best match."""
     from collections import Counter
     
-    boolean_matches = face_recognition.compare_faces(
-        loaded_encodings["encodings"], face_encoding, tolerance=0.6
+    # Same test as face_recognition.compare_faces, against the stacked matrix
+    distances = np.linalg.norm(
+        loaded_encodings["matrix"] - np.asarray(face_encoding, dtype=np.float32), axis=1
     )
+    boolean_matches = distances <= 0.6
     votes = Counter(
         name
         for match, name in zip(boolean_matches, loaded_encodings["names"])
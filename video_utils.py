@@ -29,15 +29,15 @@ def extract_frames_from_video(video_path, output_dir, frames_per_second=1, max_f
         raise ValueError(f"Could not open video: {video_path}")
     
     fps = cap.get(cv2.CAP_PROP_FPS)
-    frame_interval = int(fps / frames_per_second) if frames_per_second > 0 else 1
+    frame_interval = max(1, int(fps / frames_per_second)) if frames_per_second > 0 else 1
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     
     frame_count = 0
     saved_count = 0
     
     while True:
-        ret, frame = cap.read()
-        if not ret:
+        # grab() advances without converting the frame; only sampled frames are retrieved
+        if not cap.grab():
             break
         
         # Extract frame at specified interval
@@ -45,6 +45,10 @@ def extract_frames_from_video(video_path, output_dir, frames_per_second=1, max_f
             if max_frames and saved_count >= max_frames:
                 break
             
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+            
             # Save frame
             frame_path = output_dir / f"frame_{saved_count:05d}.jpg"
             cv2.imwrite(str(frame_path), frame)
@@ -14,12 +14,43 @@ import cv2
 from pathlib import Path
 import os
 
+# Input size the TensorRT engine is built for (engines have a fixed input shape)
+ENGINE_IMGSZ = 640
+# YOLO input sizes must be multiples of the model stride
+MODEL_STRIDE = 32
+# Smallest input size for the PyTorch model. Small inputs are still scaled up to this, so distant
+# faces in a heavily downscaled frame (e.g. detect scale 0.2 -> 128 px) keep enough pixels to be found
+MIN_IMGSZ = 448
+
+
+def _inference_imgsz(source):
+    """Input size for a PIL image or numpy frame: its longer side rounded up to the stride, within MIN_IMGSZ..ENGINE_IMGSZ."""
+    if isinstance(source, np.ndarray):
+        longest = max(source.shape[:2])
+    else:
+        longest = max(source.size)
+    return max(MIN_IMGSZ, min(ENGINE_IMGSZ, -(-longest // MODEL_STRIDE) * MODEL_STRIDE))
+
+
+def _tensorrt_available():
+    """TensorRT engines need a CUDA device and the tensorrt package."""
+    try:
+        import torch
+        if not torch.cuda.is_available():
+            return False
+        import tensorrt  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
 class YOLOFaceDetector:
     """Face detector using YOLOv11n model."""
     
     def __init__(self):
         self.model = None
         self.model_path = None
+        self.is_engine = False  # TensorRT engines only accept the size they were built for
         self._load_model()
     
     def _load_model(self):
@@ -49,7 +80,10 @@ class YOLOFaceDetector:
                 self.model_path = model_path
             
             print(f"Loading YOLOv11n model from {self.model_path}...")
-            self.model = YOLO(str(self.model_path))
+            # Prefer a TensorRT FP16 engine on NVIDIA GPUs, fall back to the PyTorch weights
+            engine = self._load_tensorrt_engine()
+            self.is_engine = engine is not None
+            self.model = engine or YOLO(str(self.model_path))
             print("✓ YOLOv11n model loaded successfully!")
             print("  Model trained on WIDERFACE dataset")
             print("  Easy AP: 94.2%, Medium AP: 92.1%, Hard AP: 81.0%")
@@ -57,6 +91,26 @@ class YOLOFaceDetector:
             print(f"Error loading YOLOv11n model: {e}")
             raise
     
+    def _load_tensorrt_engine(self):
+        """Load an FP16 TensorRT engine of the model, exporting it on first use; None if TensorRT can't be used."""
+        if not _tensorrt_available():
+            return None
+        # Cached next to the weights, keyed by precision and input size
+        engine_path = self.model_path.with_name(f"{self.model_path.stem}_fp16_{ENGINE_IMGSZ}.engine")
+        try:
+            if not engine_path.exists():
+                print("Exporting YOLOv11n to a TensorRT FP16 engine (one-time, may take a few minutes)...")
+                exported = YOLO(str(self.model_path)).export(
+                    format="engine", half=True, imgsz=ENGINE_IMGSZ, device=0
+                )
+                Path(exported).replace(engine_path)
+            model = YOLO(str(engine_path), task="detect")
+            print(f"✓ Using TensorRT engine {engine_path.name}")
+            return model
+        except Exception as e:
+            print(f"TensorRT engine not available, using PyTorch model: {e}")
+            return None
+    
     def detect_faces(self, image):
         """
         Detect faces in an image using YOLOv11n.
@@ -76,8 +130,17 @@ class YOLOFaceDetector:
         else:
             pil_image = image
         
-        # Run inference
-        results = self.model(pil_image)
+        return self._detect(pil_image)
+    
+    def _detect(self, source):
+        """Run inference on a PIL image or BGR numpy array and return face locations."""
+        # Run inference. The PyTorch model runs small (downscaled) frames at MIN_IMGSZ instead of
+        # letterboxing them up to 640: about half the compute, at the cost of some recall on the
+        # smallest faces, which the 640 input would have enlarged further. Full-size images still run at 640
+        if self.is_engine:
+            results = self.model(source)
+        else:
+            results = self.model(source, imgsz=_inference_imgsz(source))
         detections = Detections.from_ultralytics(results[0])
         
         # Convert to face_recognition format: (top, right, bottom, left)
@@ -103,9 +166,10 @@ class YOLOFaceDetector:
         Returns:
             List of face locations in format (top, right, bottom, left)
         """
-        # Convert BGR to RGB
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        return self.detect_faces(rgb_frame)
+        if self.model is None:
+            raise RuntimeError("YOLOv11n model not loaded")
+        # Ultralytics reads numpy input as BGR, so the frame needs no RGB copy
+        return self._detect(frame)
 
 # Global detector instance
 _detector_instance = None
@@ -58,7 +58,11 @@ class YOLOv8FaceDetector:
         else:
             pil_image = image
         
-        results = self.model(pil_image)
+        return self._detect(pil_image)
+    
+    def _detect(self, source):
+        """Run inference on a PIL image or BGR numpy array and return face locations."""
+        results = self.model(source)
         detections = Detections.from_ultralytics(results[0])
         
         face_locations = []
@@ -74,6 +78,8 @@ class YOLOv8FaceDetector:
     
     def detect_faces_cv2(self, frame):
         """Detect faces in OpenCV frame (BGR format)."""
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        return self.detect_faces(rgb_frame)
+        if self.model is None:
+            raise RuntimeError("YOLOv8 model not loaded")
+        # Ultralytics reads numpy input as BGR, so the frame needs no RGB copy
+        return self._detect(frame)
 